@@ -9,6 +9,7 @@ Supports custom palettes via parameter sets (#79).
 
 from typing import Dict, Any, Optional, List
 import pandas as pd
+import numpy as np
 import logging
 import re
 
@@ -240,6 +241,36 @@ def get_task_color_class(value: Any, mapping: Dict[Any, str]) -> str:
     return mapping.get(value, DEFAULT_COLOR)
 
 
+def get_task_color_classes(values: pd.Series, mapping: Dict[Any, str]) -> np.ndarray:
+    """
+    Get CSS class names for a whole column using the color mapping.
+
+    Column-wise equivalent of get_task_color_class(): the values are cast
+    to 'category' so the mapping is looked up once per distinct value and
+    broadcast through the integer category codes.
+
+    Args:
+        values: Column of categorical values
+        mapping: Color mapping dictionary from create_color_mapping()
+
+    Returns:
+        Object array of CSS class names aligned with values
+        (DEFAULT_COLOR for nulls and unmapped values)
+
+    Example:
+        >>> mapping = {'Dev': 'bar-blue', 'QA': 'bar-green'}
+        >>> get_task_color_classes(pd.Series(['QA', None, 'Dev']), mapping)
+        array(['bar-green', 'bar-gray', 'bar-blue'], dtype=object)
+    """
+    categorical = values.astype('category').cat
+    # Trailing DEFAULT_COLOR absorbs the -1 code used for nulls
+    lookup = np.array(
+        [mapping.get(value, DEFAULT_COLOR) for value in categorical.categories] + [DEFAULT_COLOR],
+        dtype=object
+    )
+    return lookup[categorical.codes.to_numpy()]
+
+
 def get_color_mapping_summary(mapping: Dict[Any, str]) -> Dict[str, Any]:
     """
     Generate a summary of the color mapping for logging/debugging.
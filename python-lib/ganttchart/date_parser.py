@@ -108,6 +108,52 @@ def parse_date_to_iso(value: any) -> Tuple[Optional[str], Optional[str]]:
     return (None, f"invalid_format: {type(value).__name__}")
 
 
+def parse_dates_to_iso(values: pd.Series) -> np.ndarray:
+    """
+    Parse a whole column of date values to ISO format strings (YYYY-MM-DD).
+
+    Column-wise equivalent of parse_date_to_iso():
+    - datetime64 columns are formatted in one vectorized strftime call
+    - Other columns are factorized and each distinct value is parsed once,
+      so repeated dates (the common case) cost a single parse; distinct
+      "YYYY-MM-DD" strings are validated together with a fixed format
+
+    Args:
+        values: Series of date values in any format parse_date_to_iso() supports
+
+    Returns:
+        Object array aligned with values: ISO date string, or None where the
+        value is null or could not be parsed
+
+    Examples:
+        >>> parse_dates_to_iso(pd.Series(["2024-01-15", None, "2024-01-15"]))
+        array(['2024-01-15', None, '2024-01-15'], dtype=object)
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        # copy=True: under Copy-on-Write to_numpy() may return a read-only view
+        formatted = values.dt.strftime('%Y-%m-%d').to_numpy(dtype=object, copy=True)
+        formatted[values.isna().to_numpy()] = None
+        return formatted
+
+    codes, uniques = values.factorize()
+    # Trailing None absorbs the -1 code factorize assigns to nulls
+    parsed = np.full(len(uniques) + 1, None, dtype=object)
+
+    # Fast path: strict "YYYY-MM-DD" strings are validated by one
+    # fixed-format pd.to_datetime call and returned unchanged
+    fast = np.zeros(len(uniques), dtype=bool)
+    if pd.api.types.infer_dtype(uniques, skipna=True) == 'string':
+        text = pd.Series(uniques, dtype=object)
+        iso = text.where(text.str.fullmatch(r'\d{4}-\d{2}-\d{2}'))
+        fast = pd.to_datetime(iso, format='%Y-%m-%d', errors='coerce').notna().to_numpy()
+        parsed[:-1][fast] = text[fast].to_numpy()
+
+    # Everything else goes through the full parse_date_to_iso() fallbacks
+    for pos in np.flatnonzero(~fast):
+        parsed[pos] = parse_date_to_iso(uniques[pos])[0]
+    return parsed[codes]
+
+
 def _validate_date_string(date_str: str) -> bool:
     """
     Validate that a string in YYYY-MM-DD format represents a valid date.
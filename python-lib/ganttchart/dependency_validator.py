@@ -5,7 +5,7 @@ Detects and breaks circular dependencies using DFS algorithm.
 Validates that all dependency references point to existing tasks.
 """
 
-from typing import List, Dict, Set, Tuple
+from typing import Collection, List, Dict, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -39,7 +39,7 @@ def detect_and_break_cycles(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
         When visiting a GRAY node from another GRAY node → cycle detected
 
     Time Complexity: O(V + E) where V = tasks, E = dependencies
-    Space Complexity: O(V) for color array and recursion stack
+    Space Complexity: O(V) for color array and DFS stack
     """
     if not tasks:
         return ([], [])
@@ -53,34 +53,47 @@ def detect_and_break_cycles(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
     cycle_edges = []  # List of (from, to) edges to remove
     warnings = []
 
-    def dfs(node: str, path: List[str]):
-        """DFS traversal with cycle detection."""
-        color[node] = GRAY
-        path.append(node)
-
-        for neighbor in adj_list.get(node, []):
-            if neighbor not in color:
-                # Neighbor references non-existent task, skip
-                continue
-
-            if color[neighbor] == GRAY:
-                # Cycle detected: neighbor is in current path
-                cycle_path = path[path.index(neighbor):] + [neighbor]
-                cycle_edges.append((node, neighbor))
-                warnings.append(
-                    f"Circular dependency detected: {' → '.join(cycle_path)}. "
-                    f"Removing edge {node} → {neighbor}."
-                )
-            elif color[neighbor] == WHITE:
-                dfs(neighbor, path)
-
-        path.pop()
-        color[node] = BLACK
+    def dfs(root: str):
+        """
+        Iterative DFS traversal with cycle detection.
+
+        Uses an explicit stack of neighbor iterators instead of recursion so
+        long dependency chains don't hit Python's recursion limit.
+        """
+        color[root] = GRAY
+        path = [root]
+        stack = [iter(adj_list.get(root, []))]
+
+        while stack:
+            node = path[-1]
+            for neighbor in stack[-1]:
+                if neighbor not in color:
+                    # Neighbor references non-existent task, skip
+                    continue
+
+                if color[neighbor] == GRAY:
+                    # Cycle detected: neighbor is in current path
+                    cycle_path = path[path.index(neighbor):] + [neighbor]
+                    cycle_edges.append((node, neighbor))
+                    warnings.append(
+                        f"Circular dependency detected: {' → '.join(cycle_path)}. "
+                        f"Removing edge {node} → {neighbor}."
+                    )
+                elif color[neighbor] == WHITE:
+                    # Descend: resume this node's remaining neighbors afterwards
+                    color[neighbor] = GRAY
+                    path.append(neighbor)
+                    stack.append(iter(adj_list.get(neighbor, [])))
+                    break
+            else:
+                # All neighbors processed
+                stack.pop()
+                color[path.pop()] = BLACK
 
     # Run DFS from all unvisited nodes
     for task_id in task_ids:
         if color[task_id] == WHITE:
-            dfs(task_id, [])
+            dfs(task_id)
 
     # Remove cycle edges from tasks
     if cycle_edges:
@@ -90,7 +103,7 @@ def detect_and_break_cycles(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
                 original_deps = task['dependencies']
                 if isinstance(original_deps, str):
                     deps_list = [d.strip() for d in original_deps.split(',') if d.strip()]
-                elif isinstance(original_deps, list):
+                elif isinstance(original_deps, (list, tuple)):
                     deps_list = [str(d).strip() for d in original_deps if d]
                 else:
                     continue
@@ -108,7 +121,10 @@ def detect_and_break_cycles(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
     return (tasks, warnings)
 
 
-def validate_dependency_references(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
+def validate_dependency_references(
+    tasks: List[Dict],
+    other_ids: Collection[str] = ()
+) -> Tuple[List[Dict], List[str]]:
     """
     Validate that all dependency references point to existing tasks.
 
@@ -116,6 +132,8 @@ def validate_dependency_references(tasks: List[Dict]) -> Tuple[List[Dict], List[
 
     Args:
         tasks: List of task dictionaries
+        other_ids: IDs of existing tasks that are not in tasks (e.g. cut
+            off by the maxTasks limit); references to them are kept
 
     Returns:
         Tuple of (modified_tasks, warnings)
@@ -124,6 +142,7 @@ def validate_dependency_references(tasks: List[Dict]) -> Tuple[List[Dict], List[
 
     # Build set of valid task IDs
     valid_ids = {task['id'] for task in tasks if 'id' in task}
+    valid_ids.update(other_ids)
 
     for task in tasks:
         if 'dependencies' not in task or not task['dependencies']:
@@ -135,7 +154,7 @@ def validate_dependency_references(tasks: List[Dict]) -> Tuple[List[Dict], List[
         # Parse dependencies
         if isinstance(deps, str):
             deps_list = [d.strip() for d in deps.split(',') if d.strip()]
-        elif isinstance(deps, list):
+        elif isinstance(deps, (list, tuple)):
             deps_list = [str(d).strip() for d in deps if d]
         else:
             continue
@@ -164,12 +183,17 @@ def validate_dependency_references(tasks: List[Dict]) -> Tuple[List[Dict], List[
     return (tasks, warnings)
 
 
-def validate_all_dependencies(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
+def validate_all_dependencies(
+    tasks: List[Dict],
+    other_ids: Collection[str] = ()
+) -> Tuple[List[Dict], List[str]]:
     """
     Run all dependency validations: reference checking and cycle detection.
 
     Args:
         tasks: List of task dictionaries
+        other_ids: IDs of existing tasks that are not in tasks, passed to
+            validate_dependency_references
 
     Returns:
         Tuple of (modified_tasks, all_warnings)
@@ -177,7 +201,7 @@ def validate_all_dependencies(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]
     all_warnings = []
 
     # First, validate references (remove invalid dependencies)
-    tasks, ref_warnings = validate_dependency_references(tasks)
+    tasks, ref_warnings = validate_dependency_references(tasks, other_ids)
     all_warnings.extend(ref_warnings)
 
     # Then, detect and break cycles
@@ -213,7 +237,7 @@ def _build_adjacency_list(tasks: List[Dict]) -> Dict[str, List[str]]:
         # Parse dependencies
         if isinstance(deps, str):
             deps_list = [d.strip() for d in deps.split(',') if d.strip()]
-        elif isinstance(deps, list):
+        elif isinstance(deps, (list, tuple)):
             deps_list = [str(d).strip() for d in deps if d]
         else:
             continue
@@ -250,7 +274,7 @@ def count_dependencies(tasks: List[Dict]) -> Dict[str, int]:
 
         if isinstance(deps, str):
             deps_list = [d.strip() for d in deps.split(',') if d.strip()]
-        elif isinstance(deps, list):
+        elif isinstance(deps, (list, tuple)):
             deps_list = [d for d in deps if d]
         else:
             continue
@@ -0,0 +1,358 @@
+"""
+Filters from Dataiku's built-in filtering UI.
+
+Supports NUMERICAL_FACET, ALPHANUM_FACET and DATE_FACET filters. Filter
+dicts are compiled once into a plan (bounds, excluded values and date-part
+keys parsed up front), which can then be applied to a whole DataFrame or to
+every chunk of a dataset read in chunks.
+
+Filters are independent row predicates: every filter is evaluated against
+the same unfiltered frame and the masks are combined with one AND, which
+gives the same rows as applying them one after another.
+
+If the filters remove every row, apply_dataiku_filters() and
+filter_chunks() raise ValueError; the backend then ignores the filters and
+shows the unfiltered data.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Facet key Dataiku uses for empty cells
+NO_VALUE_KEY = '___dku_no_value___'
+
+# DATE_FACET filter type -> (.dt component, whether facet keys are 0-based)
+DATE_PART_FILTERS = {
+    'YEAR': ('year', False),
+    'QUARTER_OF_YEAR': ('quarter', True),
+    'MONTH_OF_YEAR': ('month', True),
+    'WEEK_OF_YEAR': ('week', True),
+    'DAY_OF_MONTH': ('day', True),
+    'DAY_OF_WEEK': ('dayofweek', False),
+    'HOUR_OF_DAY': ('hour', False),
+}
+
+# Frames smaller than this evaluate their filters on the calling thread
+PARALLEL_FILTER_MIN_ROWS = 20000
+
+# Shared pool for evaluating independent filters concurrently
+_FILTER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='gantt-filter'
+)
+
+# Compiled filter: function(df, cache) -> list of boolean conditions
+Conditions = Callable[[pd.DataFrame, Dict[Any, Any]], List[Any]]
+FilterPlan = List[Tuple[Optional[str], Conditions]]
+
+
+def _numerical_filter(filter: Dict[str, Any]) -> Conditions:
+    """Compile a numerical range filter."""
+    column = filter['column']
+    min_value = filter.get("minValue")
+    max_value = filter.get("maxValue")
+
+    def conditions(df, cache):
+        result = []
+        if min_value:
+            result.append(df[column] >= min_value)
+        if max_value:
+            result.append(df[column] <= max_value)
+        return result
+    return conditions
+
+
+def _alphanum_filter(filter: Dict[str, Any]) -> Conditions:
+    """Compile an alphanumeric facet filter."""
+    column = filter['column']
+    excluded = filter.get('excludedValues', {})
+    exclude_empty = bool(excluded.get(NO_VALUE_KEY))
+    excluded_values = [k for k, v in excluded.items() if v and k != NO_VALUE_KEY]
+    if excluded_values and filter.get('columnType') == 'NUMERICAL':
+        excluded_values = np.fromiter(
+            map(float, excluded_values), dtype=np.float64, count=len(excluded_values)
+        )
+
+    def conditions(df, cache):
+        result = []
+        if exclude_empty:
+            result.append(~df[column].isnull())
+        if len(excluded_values):
+            result.append(~df[column].isin(excluded_values))
+        return result
+    return conditions
+
+
+def _date_filter(filter: Dict[str, Any]) -> Conditions:
+    """Compile a date filter."""
+    if filter.get("dateFilterType") == "RANGE":
+        return _date_range_filter(filter)
+    else:
+        return _special_date_filter(filter)
+
+
+def _date_range_filter(filter: Dict[str, Any]) -> Conditions:
+    """Compile a date range filter."""
+    column = filter['column']
+    # Bounds are epoch milliseconds (UTC)
+    min_value = filter.get("minValue")
+    max_value = filter.get("maxValue")
+    lower = pd.Timestamp(min_value, unit='ms').to_datetime64() if min_value else None
+    upper = pd.Timestamp(max_value, unit='ms').to_datetime64() if max_value else None
+
+    def conditions(df, cache):
+        result = []
+        values = _utc_datetime_array(df, column, cache)
+        if lower is not None:
+            result.append(values >= lower)
+        if upper is not None:
+            result.append(values <= upper)
+        unparsed = cache.get(('unparsed', column))
+        if result and unparsed is not None:
+            # Rows that aren't dates can't be placed in the range; keep them
+            result = [np.logical_and.reduce(result) | unparsed]
+        return result
+    return conditions
+
+
+def _special_date_filter(filter: Dict[str, Any]) -> Conditions:
+    """Compile a special date filter (year, month, day, etc.)."""
+    column = filter['column']
+    excluded_values = []
+    for k, v in filter.get('excludedValues', {}).items():
+        if v:
+            excluded_values.append(k)
+
+    date_part = DATE_PART_FILTERS.get(filter.get("dateFilterType"))
+    if not excluded_values or date_part is None:
+        return lambda df, cache: []
+
+    part, zero_based = date_part
+    if zero_based:
+        # These facets send 0-based keys; convert them once
+        excluded_values = np.fromiter(
+            (int(k) + 1 for k in excluded_values), dtype=np.int64, count=len(excluded_values)
+        )
+
+    def conditions(df, cache):
+        component = _dt_component(df, column, part, cache)
+        if zero_based:
+            # Match on the raw component values (NaT rows are NaN, which
+            # matches nothing)
+            values = component.to_numpy(dtype=np.float64, na_value=np.nan)
+            return [~np.isin(values, excluded_values)]
+        return [~component.isin(excluded_values)]
+    return conditions
+
+
+def _date_column(df: pd.DataFrame, column: str, cache: Dict[Any, Any]) -> pd.Series:
+    """
+    Return df[column] as datetime64, parsed once per column.
+
+    Columns the reader left as strings are parsed in one vectorized
+    pd.to_datetime call (as UTC, stored naive) instead of failing or
+    comparing per value. Values that call misses (e.g. a second date format
+    in the column) are retried one by one; rows that still don't parse are
+    recorded so the filters keep them rather than silently dropping them.
+    """
+    key = ('date', column)
+    if key not in cache:
+        values = df[column]
+        if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+            parsed = pd.to_datetime(values, errors='coerce', utc=True)
+            missed = (values.notna() & parsed.isna()).to_numpy()
+            if missed.any():
+                # The vectorized call infers one format for the whole column
+                parsed = parsed.copy()
+                parsed[missed] = [
+                    pd.to_datetime(value, errors='coerce', utc=True)
+                    for value in values[missed]
+                ]
+                unparsed = (values.notna() & parsed.isna()).to_numpy()
+                if unparsed.any():
+                    logger.warning(
+                        f"{int(unparsed.sum())} value(s) in column {column} are not "
+                        f"dates; date filters keep those rows"
+                    )
+                    cache[('unparsed', column)] = unparsed
+            values = parsed.dt.tz_localize(None)
+        cache[key] = values
+    return cache[key]
+
+
+def _utc_datetime_array(df: pd.DataFrame, column: str, cache: Dict[Any, Any]) -> np.ndarray:
+    """
+    Return df[column] as a naive UTC datetime64 ndarray, built once per column.
+
+    Range bounds are compared against this array directly, so each bound
+    is one C-level comparison with no Timestamp boxing (NaT compares False).
+    """
+    key = ('utc', column)
+    if key not in cache:
+        values = _date_column(df, column, cache)
+        if values.dt.tz is not None:
+            values = values.dt.tz_convert(None)
+        cache[key] = values.to_numpy()
+    return cache[key]
+
+
+def _dt_component(df: pd.DataFrame, column: str, part: str, cache: Dict[Any, Any]) -> pd.Series:
+    """Return df[column].dt.<part>, computed once per column and part."""
+    key = ('dt', column, part)
+    if key not in cache:
+        accessor = _date_column(df, column, cache).dt
+        cache[key] = accessor.isocalendar().week if part == 'week' else getattr(accessor, part)
+    return cache[key]
+
+
+def _apply_conditions(df: pd.DataFrame, conditions: List[np.ndarray]) -> pd.DataFrame:
+    """Apply list of boolean mask arrays to DataFrame."""
+    if not conditions:
+        return df
+    elif len(conditions) == 1:
+        return df[conditions[0]]
+    else:
+        # One vectorized AND over the boolean arrays (all masks come from
+        # the same df, so no index alignment is needed)
+        return df[np.logical_and.reduce(conditions)]
+
+
+# filterType -> compiler returning a function(df, cache) -> boolean conditions
+FILTER_HANDLERS = {
+    "NUMERICAL_FACET": _numerical_filter,
+    "ALPHANUM_FACET": _alphanum_filter,
+    "DATE_FACET": _date_filter,
+}
+
+
+def compile_filters(filters: List[Dict[str, Any]]) -> FilterPlan:
+    """
+    Turn filter dicts into a reusable plan.
+
+    Keys, bounds and excluded-value arrays are parsed once here, so a plan
+    applied to every chunk of a dataset does that work only once.
+
+    Args:
+        filters: List of filter dictionaries from Dataiku
+
+    Returns:
+        List of (column, function(df, cache) -> list of boolean conditions);
+        unknown filter types and filters that fail to compile are left out
+    """
+    plan = []
+    for f in filters:
+        handler = FILTER_HANDLERS.get(f.get("filterType"))
+        if handler is None:
+            continue
+        try:
+            plan.append((f.get('column'), handler(f)))
+        except Exception as e:
+            logger.warning(f"Error applying filter on column {f.get('column')}: {e}")
+    return plan
+
+
+def apply_filter_plan(df: pd.DataFrame, plan: FilterPlan) -> pd.DataFrame:
+    """
+    Apply a compiled filter plan to a DataFrame.
+
+    A filter that fails on this frame (e.g. its column is missing) is
+    skipped with a warning; the others still apply.
+
+    Args:
+        df: Input DataFrame
+        plan: Result of compile_filters
+
+    Returns:
+        Filtered DataFrame
+
+    Raises:
+        ValueError: If no rows are left after filtering
+    """
+    # Parsed date columns and .dt components, shared by the filters of
+    # this call (keyed by column, so they stay aligned with df's rows)
+    cache = {}
+
+    def filter_masks(step):
+        """Evaluate one filter to a list of boolean arrays ([] if it fails)."""
+        column, conditions = step
+        try:
+            return [np.asarray(c, dtype=bool) for c in conditions(df, cache)]
+        except Exception as e:
+            logger.warning(f"Error applying filter on column {column}: {e}")
+            return []
+
+    # Evaluate every filter against the unfiltered frame and slice once at
+    # the end. Filters are independent, so on large frames several run
+    # concurrently (the work is mostly NumPy/pandas code that releases the
+    # GIL); a cache entry computed by two threads at once is just computed
+    # twice. Small frames are faster without the thread hand-off.
+    if len(plan) > 1 and len(df) >= PARALLEL_FILTER_MIN_ROWS:
+        per_filter = list(_FILTER_EXECUTOR.map(filter_masks, plan))
+    else:
+        per_filter = [filter_masks(step) for step in plan]
+    masks = [mask for filter_result in per_filter for mask in filter_result]
+
+    df = _apply_conditions(df, masks)
+
+    if df.empty:
+        raise ValueError("DataFrame is empty after filtering")
+
+    return df
+
+
+def apply_dataiku_filters(df: pd.DataFrame, filters: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Apply filters from Dataiku's built-in filtering UI.
+
+    Args:
+        df: Input DataFrame
+        filters: List of filter dictionaries from Dataiku
+
+    Returns:
+        Filtered DataFrame
+
+    Raises:
+        ValueError: If no rows are left after filtering
+    """
+    return apply_filter_plan(df, compile_filters(filters))
+
+
+def filter_chunks(
+    chunks: Iterable[pd.DataFrame],
+    filters: List[Dict[str, Any]]
+) -> pd.DataFrame:
+    """
+    Filter a dataset read in chunks, keeping only the rows that pass.
+
+    Filters are row-wise, so filtering each chunk gives the same rows as
+    filtering the concatenated frame, while filtered-out rows are dropped
+    one chunk at a time instead of all being held in memory.
+
+    Args:
+        chunks: DataFrames making up the dataset, in order
+        filters: List of filter dictionaries from Dataiku
+
+    Returns:
+        Concatenated surviving rows
+
+    Raises:
+        ValueError: If no rows are left after filtering (as
+            apply_dataiku_filters does for a whole frame)
+    """
+    plan = compile_filters(filters)
+    kept = []
+    for chunk in chunks:
+        try:
+            kept.append(apply_filter_plan(chunk, plan))
+        except ValueError:
+            continue  # Every row of this chunk was filtered out
+
+    if not kept:
+        raise ValueError("DataFrame is empty after filtering")
+    return kept[0] if len(kept) == 1 else pd.concat(kept)
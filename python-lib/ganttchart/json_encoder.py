@@ -0,0 +1,136 @@
+"""
+JSON serialization for Gantt chart responses.
+
+Uses orjson when it is installed: it serializes numpy scalars/arrays and
+datetimes natively in C and is much faster than the stdlib encoder on large
+task lists, and parses request parameters faster too. Falls back to the
+json module with a default hook covering the same types, so output stays
+valid when orjson is not available.
+"""
+
+import datetime
+import json
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the code env
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """
+    Convert values the stdlib encoder does not handle.
+
+    Args:
+        value: Object json.dumps could not serialize
+
+    Returns:
+        JSON-compatible equivalent
+
+    Raises:
+        TypeError: If the value type is not supported
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, datetime.datetime):
+        # Naive datetimes are treated as UTC, as orjson's OPT_NAIVE_UTC does
+        if value.tzinfo is None:
+            return value.isoformat() + '+00:00'
+        return value.isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _plain_keys(obj: Any) -> Any:
+    """
+    Copy nested dicts/lists, converting numpy scalar dict keys to Python.
+
+    Args:
+        obj: Payload that may contain dicts keyed by numpy scalars
+
+    Returns:
+        Equivalent payload whose dict keys the json module accepts
+    """
+    if isinstance(obj, dict):
+        return {
+            (key.item() if isinstance(key, np.generic) else key): _plain_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_plain_keys(value) for value in obj]
+    return obj
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize a response payload to UTF-8 encoded JSON.
+
+    Skips the bytes-to-str round trip of dumps() when the result is sent
+    as a response body as is.
+
+    Args:
+        obj: Payload (dicts, lists, Python/numpy scalars, datetimes)
+
+    Returns:
+        JSON as UTF-8 bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                option=(orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+                        | orjson.OPT_NON_STR_KEYS),
+                default=_default
+            )
+        except TypeError:
+            # orjson cannot use numpy scalars as dict keys (e.g. the color
+            # mapping of a float column); the stdlib path below handles them
+            pass
+    try:
+        text = json.dumps(obj, default=_default, separators=(',', ':'))
+    except TypeError:
+        # Only numpy float keys are float subclasses; retry with plain keys
+        text = json.dumps(_plain_keys(obj), default=_default, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a response payload to a JSON string.
+
+    Args:
+        obj: Payload (dicts, lists, Python/numpy scalars, datetimes)
+
+    Returns:
+        JSON string
+
+    Example:
+        >>> dumps({'progress': np.int64(50)})
+        '{"progress":50}'
+    """
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def loads(text: Any) -> Any:
+    """
+    Parse a JSON request parameter.
+
+    Args:
+        text: JSON document as str or bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If the text is not valid JSON (json.JSONDecodeError,
+            which orjson's error subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -0,0 +1,92 @@
+"""
+Request parameter validation for the Gantt chart backend.
+
+Checks the shape of the parsed /get-tasks config and filters up front, so
+a malformed request is rejected before the dataset is read instead of
+failing deep inside pandas or the transformer.
+"""
+
+from typing import Any
+
+# Config keys holding a single column name
+COLUMN_KEYS = (
+    'idColumn',
+    'nameColumn',
+    'startColumn',
+    'endColumn',
+    'progressColumn',
+    'dependenciesColumn',
+    'colorColumn'
+)
+
+
+def _is_column_list(value: Any) -> bool:
+    """Return True if value is a list of column names."""
+    return isinstance(value, list) and all(isinstance(col, str) for col in value)
+
+
+def validate_request(config: Any, filters: Any) -> None:
+    """
+    Validate parsed /get-tasks request parameters.
+
+    Only shapes the backend cannot work with are rejected; whether the
+    columns exist is checked later against the dataset.
+
+    Args:
+        config: Parsed config parameter
+        filters: Parsed filters parameter
+
+    Raises:
+        ValueError: Describing the first problem found
+
+    Example:
+        >>> validate_request({'idColumn': 'id', 'maxTasks': 500}, [])
+        >>> validate_request({'maxTasks': 'all'}, [])
+        Traceback (most recent call last):
+        ...
+        ValueError: maxTasks must be an integer
+    """
+    if not isinstance(config, dict):
+        raise ValueError("config must be a JSON object")
+
+    for key in COLUMN_KEYS:
+        value = config.get(key)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{key} must be a column name")
+
+    tooltip_columns = config.get('tooltipColumns')
+    if tooltip_columns is not None and not (
+            isinstance(tooltip_columns, str) or _is_column_list(tooltip_columns)):
+        raise ValueError("tooltipColumns must be a list of column names")
+
+    group_by_columns = config.get('groupByColumns')
+    if group_by_columns is not None and not _is_column_list(group_by_columns):
+        raise ValueError("groupByColumns must be a list of column names")
+
+    max_tasks = config.get('maxTasks', 1000)
+    if isinstance(max_tasks, bool):
+        raise ValueError("maxTasks must be an integer")
+    try:
+        int(max_tasks)
+    except (TypeError, ValueError):
+        raise ValueError("maxTasks must be an integer") from None
+
+    _validate_filters(filters)
+
+
+def _validate_filters(filters: Any) -> None:
+    """
+    Validate the filters parameter.
+
+    Args:
+        filters: Parsed filters parameter
+
+    Raises:
+        ValueError: If filters is not a list of filter objects
+    """
+    if not isinstance(filters, list):
+        raise ValueError("filters must be a JSON array")
+
+    for i, f in enumerate(filters):
+        if not isinstance(f, dict):
+            raise ValueError(f"filters[{i}] must be a JSON object")
@@ -12,6 +12,16 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# sort_tasks criteria implemented as one stable key sort (not 'dependencies')
+_STABLE_KEY_SORTS = frozenset({
+    'none',
+    'start_asc', 'start_desc',
+    'end_asc', 'end_desc',
+    'name_asc', 'name_desc',
+    'duration_asc', 'duration_desc'
+})
+
+
 def sort_tasks(tasks: List[Dict[str, Any]], sort_by: str) -> List[Dict[str, Any]]:
     """
     Sort tasks based on the specified criteria.
@@ -180,6 +190,21 @@ def group_and_sort_tasks(
         f"Grouping {len(tasks)} tasks by {len(group_by_columns)} columns: {group_by_columns}"
     )
 
+    if sort_by in _STABLE_KEY_SORTS:
+        # Key sorts are stable, so sorting everything once and then stably
+        # sorting by the group path leaves each group in sort_by order: the
+        # same result as the recursive grouping below, in two C-level sorts
+        def group_path(task: Dict[str, Any]) -> tuple:
+            group_vals = task.get('_group_values', {})
+            path = []
+            for col in group_by_columns:
+                val = group_vals.get(col)
+                # Tasks without a value go after every named group
+                path.append((1, '') if val is None or val == '' else (0, str(val)))
+            return tuple(path)
+
+        return sorted(sort_tasks(tasks, sort_by), key=group_path)
+
     def group_recursive(task_list: List[Dict[str, Any]], columns: List[str], depth: int = 0) -> List[Dict[str, Any]]:
         """
         Recursively group tasks by columns and sort within each group.
@@ -5,24 +5,126 @@ Main orchestrator that transforms DataFrame rows into Frappe Gantt task objects.
 Handles all edge cases and coordinates date parsing, color mapping, and dependency validation.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, date
 import pandas as pd
+import numpy as np
 import logging
 import re
+from functools import lru_cache
 
-from ganttchart.date_parser import parse_date_to_iso, validate_date_range
-from ganttchart.color_mapper import create_color_mapping, get_task_color_class
+from ganttchart.date_parser import parse_dates_to_iso
+from ganttchart.color_mapper import create_color_mapping, get_task_color_classes
 from ganttchart.dependency_validator import validate_all_dependencies
 from ganttchart.sort_utils import sort_tasks
 
 logger = logging.getLogger(__name__)
 
+# Keep alphanumerics, underscores, and hyphens (CSS-safe)
+# Encode everything else as _xHH_ where HH is the hex code
+_CSS_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9_-]')
 
-@dataclass
+# Zero-padded ISO dates, whose string order is their date order
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _encode_css_char(match: re.Match) -> str:
+    return f'_x{ord(match.group(0)):02x}_'
+
+
+def _rename_duplicate_ids(ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Number repeated task IDs (#76).
+
+    Args:
+        ids: Object array of task IDs, in row order
+
+    Returns:
+        Tuple of (occurrence, renamed): 0 for the first occurrence of an ID
+        and n for its n-th repeat, and the IDs with repeats renamed to
+        '<id>_<n>'
+    """
+    occurrence = pd.Series(ids, dtype=object).groupby(ids, sort=False).cumcount().to_numpy()
+    renamed = np.where(occurrence == 0, ids, ids + '_' + occurrence.astype(str))
+    return occurrence, renamed
+
+
+def _today() -> date:
+    """Current date used for expected progress (patched in tests)."""
+    return date.today()
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _normalize_hashable_id(value: Any) -> str:
+    """
+    Core of TaskTransformer._normalize_id() for non-null values.
+
+    Memoized because the same IDs recur across rows and dependency lists;
+    typed=True keeps e.g. True, 1 and 1.0 in separate cache entries.
+
+    Args:
+        value: Non-null ID value
+
+    Returns:
+        Normalized, CSS-safe string representation
+    """
+    # Handle numeric types - convert whole number floats to int representation
+    # This solves the Pandas type mismatch where:
+    # - ID column (no NaNs): read as int64 → 277 → "277"
+    # - Dependency column (has NaNs): read as float64 → 276.0 → "276.0"
+    # We normalize both to "276" so they match
+    if isinstance(value, float):
+        # Check if it's a whole number (e.g., 276.0)
+        if value.is_integer():
+            return str(int(value))
+        else:
+            # Non-integer float (e.g., 54.8) - make CSS-safe
+            return _CSS_UNSAFE_RE.sub(_encode_css_char, str(value).strip())
+
+    # For strings, also check if they look like whole-number floats
+    # This handles "1.0" -> "1" for dependency strings like "1.0, 2.0"
+    if isinstance(value, str):
+        stripped = value.strip()
+        try:
+            float_val = float(stripped)
+            if float_val.is_integer():
+                return str(int(float_val))
+            else:
+                # Non-integer float string - make CSS-safe
+                return _CSS_UNSAFE_RE.sub(_encode_css_char, stripped)
+        except (ValueError, TypeError):
+            pass
+        # General string - make CSS-safe
+        return _CSS_UNSAFE_RE.sub(_encode_css_char, stripped)
+
+    # For all other types (int, Decimal, etc.), convert directly
+    return _CSS_UNSAFE_RE.sub(_encode_css_char, str(value).strip())
+
+
+def _clip_progress(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Truncate toward zero and clamp progress values to [0, 100].
+
+    Runs as a handful of in-place ufunc passes over a float64 array.
+
+    Args:
+        values: float64 progress values, NaN where missing or invalid
+
+    Returns:
+        Tuple of (int64 progress values, boolean validity mask). Entries
+        where the mask is False are 0 and should be ignored.
+    """
+    valid = ~np.isnan(values)
+    clipped = np.trunc(values)
+    np.clip(clipped, 0, 100, out=clipped)
+    clipped[~valid] = 0
+    return clipped.astype(np.int64), valid
+
+
+@dataclass(frozen=True)
 class TaskTransformerConfig:
-    """Configuration for the task transformer."""
+    """Configuration for the task transformer (immutable once built)."""
     id_column: str
     start_column: str
     end_column: str
@@ -46,7 +148,7 @@ class TaskTransformer:
     Pipeline:
     1. Validate configuration
     2. Create color mapping (if colorColumn specified)
-    3. Process each row
+    3. Build task fields column-wise and zip them into task objects
     4. Validate dependencies
     5. Apply maxTasks limit
     6. Return {tasks, metadata}
@@ -73,7 +175,10 @@ class TaskTransformer:
         Main transformation method.
 
         Args:
-            df: Input DataFrame with task data
+            df: Input DataFrame with task data. Rows are processed column by
+                column (no iterrows/apply), but object-dtype IDs and
+                non-numeric tooltip columns are still type-checked value by
+                value to format mixed types.
 
         Returns:
             Dictionary with structure:
@@ -104,79 +209,165 @@ class TaskTransformer:
         # Validate
         self._validate_config(df)
 
+        # Bind config fields to locals once
+        config = self.config
+        id_col = config.id_column
+        name_col = config.name_column
+        start_col = config.start_column
+        end_col = config.end_column
+        progress_col = config.progress_column
+        deps_col = config.dependencies_column
+        color_col = config.color_column
+        max_tasks = config.max_tasks
+        tooltip_cols = config.tooltip_columns or ()
+        if isinstance(tooltip_cols, str):
+            tooltip_cols = (tooltip_cols,)
+        tooltip_cols = tuple(tooltip_cols)
+        # Hash set of column names for the membership checks below
+        available = frozenset(df.columns)
+
         self.stats['total_rows'] = len(df)
 
         # Create color mapping if needed
         color_mapping = None
-        if self.config.color_column:
+        if color_col:
             color_mapping = create_color_mapping(
                 df,
-                self.config.color_column,
-                self.config.color_palette,  # (#49) Pass palette selection
-                self.config.custom_colors  # (#79) Pass custom palette colors
+                color_col,
+                config.color_palette,  # (#49) Pass palette selection
+                config.custom_colors  # (#79) Pass custom palette colors
             )
             if color_mapping:
                 logger.info(f"Created color mapping with {len(color_mapping)} categories")
 
-        # Process rows with enhanced duplicate tracking (#76)
-        tasks = []
-        seen_ids = {}  # Track duplicate IDs: {id: [list of row indices]}
-        duplicate_info = {}  # Structured duplicate data for metadata
-
-        for row_idx, row in df.iterrows():
-            task = self._process_row(row, row_idx, color_mapping)
-            if task:
-                task_id = task['id']
-
-                if task_id in seen_ids:
-                    # Duplicate found - compute suffix before appending
-                    suffix = len(seen_ids[task_id])
-                    seen_ids[task_id].append(row_idx)
-
-                    if self.config.duplicate_id_handling == 'skip':
-                        # Skip mode: don't add duplicate, track it
-                        self._increment_skip_reason('duplicate_id')
-                        if task_id not in duplicate_info:
-                            duplicate_info[task_id] = {
-                                'originalId': task_id,
-                                'occurrences': [{'rowIndex': seen_ids[task_id][0], 'status': 'kept'}]
-                            }
-                        duplicate_info[task_id]['occurrences'].append({
-                            'rowIndex': row_idx,
-                            'status': 'skipped'
-                        })
-                        continue  # Skip this row
-                    else:
-                        # Rename mode (default): rename and add
-                        new_id = f"{task_id}_{suffix}"
-                        task['id'] = new_id
-
-                        # Track for structured metadata
-                        if task_id not in duplicate_info:
-                            duplicate_info[task_id] = {
-                                'originalId': task_id,
-                                'occurrences': [{'rowIndex': seen_ids[task_id][0], 'assignedId': task_id}]
-                            }
-                        duplicate_info[task_id]['occurrences'].append({
-                            'rowIndex': row_idx,
-                            'assignedId': new_id
-                        })
-
-                        self.warnings.append(
-                            f"Duplicate task ID '{task_id}' at row {row_idx}. "
-                            f"Renamed to '{new_id}'."
-                        )
-                else:
-                    seen_ids[task_id] = [row_idx]
-
-                tasks.append(task)
+        # Parse date columns once up front instead of per row
+        start_dates = parse_dates_to_iso(df[start_col])
+        end_dates = parse_dates_to_iso(df[end_col])
+
+        skip_masks = self._date_skip_masks(df.index, start_dates, end_dates)
+        keep = ~np.logical_or.reduce(list(skip_masks.values()))
+        # Count each skip reason once, from its mask
+        self.stats['skip_reasons'] = {
+            reason: int(mask.sum()) for reason, mask in skip_masks.items() if mask.any()
+        }
+
+        # Apply maxTasks limit before building tasks when output keeps row order
+        # (no sort, and renamed duplicates keep one task per valid row): only
+        # the first max_tasks valid rows are processed any further
+        task_count = int(keep.sum())
+        truncated_from = None
+        # Names of the valid tasks cut off, by task ID: dependencies on them
+        # stay valid and are displayed by name, as when truncating at the end
+        cut_off_names = {}
+        if (max_tasks > 0 and task_count > max_tasks
+                and config.sort_by == 'none'
+                and config.duplicate_id_handling == 'rename'):
+            cut_off_names = self._task_names(df.loc[keep], max_tasks)
+            cut = int(np.flatnonzero(keep)[max_tasks - 1]) + 1
+            df = df.iloc[:cut]
+            keep = keep[:cut]
+            start_dates = start_dates[:cut]
+            end_dates = end_dates[:cut]
+            truncated_from = task_count
+
+        # Keep only the valid rows, and only the columns tasks are built from
+        group_cols = [col for col in (config.group_by_columns or []) if col in available]
+        read_columns = [
+            id_col,
+            name_col,
+            progress_col,
+            deps_col,
+            color_col if color_mapping else None,
+            *tooltip_cols,
+            *group_cols
+        ]
+        valid = df.loc[keep, [
+            col for col in dict.fromkeys(read_columns)
+            if col is not None and col in available
+        ]]
+        task_rows = valid.index.tolist()  # Row index of each valid task
+        count = len(task_rows)
+
+        # Build tasks column-wise: one list per task field, aligned with task_rows
+        fields = {}
+        fields['id'], fields['_display_id'] = self._extract_ids(valid[id_col])
+        if name_col:
+            fields['name'] = self._extract_names(
+                valid[name_col], fields['_display_id']
+            )
+        else:
+            fields['name'] = fields['_display_id']  # Use display ID for name, not CSS-safe ID
+        fields['start'] = start_dates[keep].tolist()
+        fields['end'] = end_dates[keep].tolist()
+        # Drop full-length intermediates (and the local frame alias) once consumed
+        del df, start_dates, end_dates, keep, skip_masks
+
+        # Expected progress (where task should be based on today's date)
+        today = _today()
+        fields['_expected_progress'] = [
+            self._calculate_expected_progress(start, end, today)
+            for start, end in zip(fields['start'], fields['end'])
+        ]
+
+        if progress_col:
+            fields['progress'] = self._extract_progress(valid[progress_col])
+        else:
+            fields['progress'] = [None] * count
+
+        if deps_col:
+            fields['dependencies'], fields['_display_dependencies'] = self._extract_dependencies(
+                valid[deps_col]
+            )
+
+        # Color class based on color column OR progress-based default
+        if color_mapping:
+            fields['custom_class'] = get_task_color_classes(
+                valid[color_col], color_mapping
+            ).tolist()
+        else:
+            # Single class (no spaces) - Frappe Gantt uses classList.add() which rejects whitespace
+            fields['custom_class'] = [
+                f'bar-default-tier-{self._get_progress_tier(progress or 0)}'
+                for progress in fields['progress']
+            ]
+
+        # Completion flag for all palettes (#31 - completion indicator)
+        fields['_is_complete'] = [progress == 100 for progress in fields['progress']]
+
+        # Tooltip values are formatted per column; missing columns are ignored
+        formatted_tooltips = {
+            col: self._format_tooltip_column(valid[col])
+            for col in dict.fromkeys(tooltip_cols)
+            if col in available
+        }
+        tooltip_labels = [col for col in tooltip_cols if col in formatted_tooltips]
+        if tooltip_labels:
+            fields['custom_fields'] = [
+                [{'label': label, 'value': value} for label, value in zip(tooltip_labels, values)]
+                for values in zip(*(formatted_tooltips[col] for col in tooltip_labels))
+            ]
+
+        # Group column values for hierarchical sorting
+        if group_cols:
+            formatted_groups = [self._format_group_column(valid[col]) for col in group_cols]
+            fields['_group_values'] = [
+                dict(zip(group_cols, values)) for values in zip(*formatted_groups)
+            ]
+
+        # Release the column projection before the task dicts are built
+        del valid, formatted_tooltips
+        tasks = self._materialize_tasks(fields, count)
+        del fields
+
+        # Enhanced duplicate tracking (#76)
+        tasks, duplicate_info = self._handle_duplicate_ids(tasks, task_rows)
 
         # Store structured duplicate info in stats for metadata (#76)
         if duplicate_info:
             self.stats['duplicate_ids'] = list(duplicate_info.values())
 
             # Check for dependency impact when IDs were renamed (#76)
-            if self.config.duplicate_id_handling == 'rename':
+            if config.duplicate_id_handling == 'rename':
                 renamed_ids = set()
                 for dup in duplicate_info.values():
                     renamed_ids.add(dup['originalId'])
@@ -195,14 +386,14 @@ class TaskTransformer:
 
         # Validate dependencies
         if tasks:
-            tasks, dep_warnings = validate_all_dependencies(tasks)
+            tasks, dep_warnings = validate_all_dependencies(tasks, cut_off_names)
             self.warnings.extend(dep_warnings)
 
             # Sort tasks
-            tasks = sort_tasks(tasks, self.config.sort_by)
+            tasks = sort_tasks(tasks, config.sort_by)
 
             # Resolve dependency IDs to task names for display (#65)
-            id_to_name = {t['id']: t['name'] for t in tasks}
+            id_to_name = {**cut_off_names, **{t['id']: t['name'] for t in tasks}}
             for task in tasks:
                 if task.get('dependencies'):
                     resolved_names = []
@@ -212,12 +403,14 @@ class TaskTransformer:
                         resolved_names.append(name)
                     task['_display_dependencies'] = ', '.join(resolved_names)
 
-        # Apply maxTasks limit
-        if self.config.max_tasks > 0 and len(tasks) > self.config.max_tasks:
-            original_count = len(tasks)
-            tasks = tasks[:self.config.max_tasks]
+        # Apply maxTasks limit (already applied up front when truncated_from is set)
+        if max_tasks > 0 and len(tasks) > max_tasks:
+            truncated_from = len(tasks)
+            tasks = tasks[:max_tasks]
+        if truncated_from is not None:
+            original_count = truncated_from
             self.warnings.append(
-                f"Dataset has {original_count} tasks. Displaying first {self.config.max_tasks} "
+                f"Dataset has {original_count} tasks. Displaying first {max_tasks} "
                 f"due to maxTasks limit. Consider filtering the data or increasing maxTasks."
             )
 
@@ -243,6 +436,148 @@ class TaskTransformer:
 
         return result
 
+    def _date_skip_masks(
+        self,
+        index: pd.Index,
+        start_dates: np.ndarray,
+        end_dates: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Flag rows that must be skipped because of their dates.
+
+        Both checks run as whole-column operations: missing dates give
+        'invalid_dates', start > end (compared as ISO strings) gives
+        'start_after_end'.
+
+        Args:
+            index: DataFrame index, used for warning messages
+            start_dates: Parsed ISO start dates (None if invalid)
+            end_dates: Parsed ISO end dates (None if invalid)
+
+        Returns:
+            Skip reason -> boolean array, True for rows skipped for that reason
+        """
+        starts = pd.Series(start_dates, dtype=object)
+        ends = pd.Series(end_dates, dtype=object)
+        invalid_dates = (starts.isna() | ends.isna()).to_numpy()
+
+        # The dates are already validated, and zero-padded YYYY-MM-DD strings
+        # sort in date order, so compare the text directly. (Converting to
+        # datetime64[ns] would turn dates such as 9999-12-31 into NaT.)
+        start_text = starts.fillna('').to_numpy(dtype=str)
+        end_text = ends.fillna('').to_numpy(dtype=str)
+        iso = (
+            pd.Series(start_text, dtype=object).str.fullmatch(_ISO_DATE_RE)
+            & pd.Series(end_text, dtype=object).str.fullmatch(_ISO_DATE_RE)
+        ).to_numpy(dtype=bool)
+        start_after_end = ~invalid_dates & ~(iso & (start_text <= end_text))
+
+        for pos in np.flatnonzero(start_after_end):
+            logger.warning(
+                f"Row {index[pos]}: Start date {start_dates[pos]} is after end date "
+                f"{end_dates[pos]}. Skipping."
+            )
+
+        return {
+            'invalid_dates': invalid_dates,
+            'start_after_end': start_after_end
+        }
+
+    def _task_names(self, valid: pd.DataFrame, start: int) -> Dict[str, str]:
+        """
+        Map task ID to name for the valid rows from position start on.
+
+        IDs are renamed as _handle_duplicate_ids renames them, so they match
+        the IDs those rows would get as tasks. Only the ID and name columns
+        are read.
+
+        Args:
+            valid: Rows with valid dates, in row order
+            start: Position of the first row to include
+
+        Returns:
+            Task ID -> task name
+        """
+        ids, display_ids = self._extract_ids(valid[self.config.id_column])
+        name_col = self.config.name_column
+        names = self._extract_names(valid[name_col], display_ids) if name_col else display_ids
+        _, renamed = _rename_duplicate_ids(np.array(ids, dtype=object))
+        return dict(zip(renamed[start:].tolist(), names[start:]))
+
+    def _handle_duplicate_ids(
+        self,
+        tasks: List[Dict[str, Any]],
+        task_rows: List[Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Rename or drop tasks whose ID repeats an earlier task's ID (#76).
+
+        Occurrence numbers come from a single groupby().cumcount() over all
+        task IDs; only the duplicated tasks are then visited in Python.
+
+        Args:
+            tasks: Valid tasks in row order
+            task_rows: Row index of each task
+
+        Returns:
+            Tuple of (tasks, duplicate_info) where duplicate_info maps each
+            duplicated ID to its structured metadata entry
+        """
+        duplicate_info = {}
+        if not tasks:
+            return tasks, duplicate_info
+
+        ids = np.array([task['id'] for task in tasks], dtype=object)
+        occurrence, renamed = _rename_duplicate_ids(ids)
+        duplicate_positions = np.flatnonzero(occurrence)
+        if len(duplicate_positions) == 0:
+            return tasks, duplicate_info
+
+        first_rows = dict(zip(reversed(ids), reversed(task_rows)))  # First row per ID
+        skip = self.config.duplicate_id_handling == 'skip'
+
+        for pos in duplicate_positions:
+            task_id = ids[pos]
+            row_idx = task_rows[pos]
+
+            if skip:
+                # Skip mode: don't add duplicate, track it
+                if task_id not in duplicate_info:
+                    duplicate_info[task_id] = {
+                        'originalId': task_id,
+                        'occurrences': [{'rowIndex': first_rows[task_id], 'status': 'kept'}]
+                    }
+                duplicate_info[task_id]['occurrences'].append({
+                    'rowIndex': row_idx,
+                    'status': 'skipped'
+                })
+            else:
+                # Rename mode (default): rename and add
+                new_id = renamed[pos]
+                tasks[pos]['id'] = new_id
+
+                # Track for structured metadata
+                if task_id not in duplicate_info:
+                    duplicate_info[task_id] = {
+                        'originalId': task_id,
+                        'occurrences': [{'rowIndex': first_rows[task_id], 'assignedId': task_id}]
+                    }
+                duplicate_info[task_id]['occurrences'].append({
+                    'rowIndex': row_idx,
+                    'assignedId': new_id
+                })
+
+                self.warnings.append(
+                    f"Duplicate task ID '{task_id}' at row {row_idx}. "
+                    f"Renamed to '{new_id}'."
+                )
+
+        if skip:
+            self.stats['skip_reasons']['duplicate_id'] = len(duplicate_positions)
+            tasks = [task for task, count in zip(tasks, occurrence) if count == 0]
+
+        return tasks, duplicate_info
+
     def _validate_config(self, df: pd.DataFrame) -> None:
         """
         Validate configuration and DataFrame.
@@ -253,9 +588,12 @@ class TaskTransformer:
         Raises:
             ValueError: If validation fails
         """
-        if df.empty:
+        # Cheapest check first: nothing else is touched for an empty frame
+        if df is None or df.empty:
             raise ValueError("DataFrame is empty")
 
+        available = frozenset(df.columns)
+
         # Check required columns exist
         required_cols = [
             self.config.id_column,
@@ -263,7 +601,7 @@ class TaskTransformer:
             self.config.end_column
         ]
 
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in available]
         if missing_cols:
             raise ValueError(
                 f"Required columns not found: {', '.join(missing_cols)}. "
@@ -283,188 +621,205 @@ class TaskTransformer:
         if self.config.tooltip_columns:
             optional_cols.extend(self.config.tooltip_columns)
 
-        missing_optional = [col for col in optional_cols if col not in df.columns]
+        missing_optional = [col for col in optional_cols if col not in available]
         if missing_optional:
             logger.warning(f"Optional columns not found: {', '.join(missing_optional)}")
 
-    def _process_row(
-        self,
-        row: pd.Series,
-        row_idx: int,
-        color_mapping: Optional[Dict[Any, str]]
-    ) -> Optional[Dict[str, Any]]:
+    def _extract_ids(self, values: pd.Series) -> Tuple[List[str], List[str]]:
         """
-        Process a single DataFrame row into a task object.
+        Extract task IDs for a whole column.
+
+        Stores both CSS-safe IDs (for internal use) and display IDs (for
+        tooltips). Null or blank IDs are generated from the row index.
 
         Args:
-            row: DataFrame row
-            row_idx: Row index for generating fallback values
-            color_mapping: Optional color mapping dictionary
+            values: ID column from DataFrame (valid rows only)
 
         Returns:
-            Task dictionary or None if row should be skipped
+            Tuple of (CSS-safe task IDs, display IDs), aligned with values
         """
-        # Parse dates
-        start_val = row[self.config.start_column]
-        end_val = row[self.config.end_column]
+        task_ids = self._normalize_id_series(values)
+        # Written into below, so take a writable copy (see _normalize_id_series)
+        text = values.astype(object).astype(str).str.strip().to_numpy(dtype=object, copy=True)
+        blank = values.isna().to_numpy() | (text == '')
+
+        # Keep original value for display (handles floats, strings, etc.);
+        # whole-number floats display as their int representation
+        display_ids = text
+        if values.dtype.kind == 'f':
+            floats = np.ones(len(values), dtype=bool)
+        elif values.dtype == object:
+            floats = np.fromiter(
+                (isinstance(v, float) for v in values.tolist()), dtype=bool, count=len(values)
+            )
+        else:
+            floats = np.zeros(len(values), dtype=bool)
+        if floats.any():
+            as_float = values[floats].to_numpy(dtype=np.float64, na_value=np.nan)
+            whole = np.flatnonzero(floats)[np.isfinite(as_float) & (as_float == np.trunc(as_float))]
+            display_ids[whole] = task_ids[whole]
 
-        start_date, start_error = parse_date_to_iso(start_val)
-        end_date, end_error = parse_date_to_iso(end_val)
+        if blank.any():
+            # Generated IDs are already display-friendly
+            generated = [f"task_{row_idx}" for row_idx in values.index[blank]]
+            task_ids[blank] = generated
+            display_ids[blank] = generated
 
-        # Skip if dates invalid
-        if not start_date or not end_date:
-            self._increment_skip_reason('invalid_dates')
-            return None
+        return task_ids.tolist(), display_ids.tolist()
 
-        # Skip if start > end
-        if not validate_date_range(start_date, end_date):
-            self._increment_skip_reason('start_after_end')
-            logger.warning(
-                f"Row {row_idx}: Start date {start_date} is after end date {end_date}. Skipping."
-            )
-            return None
+    def _extract_names(self, values: pd.Series, display_ids: List[str]) -> List[str]:
+        """
+        Extract task names for a whole column, falling back to the display ID
+        when the value is missing or blank.
 
-        # Extract task ID (generate if null)
-        # Store both CSS-safe ID (for internal use) and display ID (for tooltips)
-        raw_id = row[self.config.id_column]
-        if pd.isna(raw_id) or str(raw_id).strip() == '':
-            task_id = f"task_{row_idx}"
-            display_id = task_id  # Generated IDs are already display-friendly
-        else:
-            task_id = self._normalize_id(raw_id)
-            # Keep original value for display (handles floats, strings, etc.)
-            display_id = str(raw_id).strip() if not isinstance(raw_id, float) else (
-                str(int(raw_id)) if raw_id.is_integer() else str(raw_id)
-            )
+        Args:
+            values: Name column from DataFrame (valid rows only)
+            display_ids: Display IDs aligned with values
 
-        # Extract task name (use ID if column not configured or value missing)
-        task_name = None
-        if self.config.name_column:
-            val = row[self.config.name_column]
-            if not pd.isna(val) and str(val).strip() != '':
-                task_name = str(val).strip()
-
-        if not task_name:
-            task_name = display_id  # Use display ID for name, not CSS-safe ID
-
-        # Build task object
-        task = {
-            'id': task_id,
-            '_display_id': display_id,  # Original ID for tooltip display
-            'name': task_name,
-            'start': start_date,
-            'end': end_date
-        }
+        Returns:
+            List of task names aligned with values
+        """
+        names = values.astype(object).astype(str).str.strip().where(values.notna(), '').tolist()
+        return [name or display_id for name, display_id in zip(names, display_ids)]
 
-        # Add expected progress (where task should be based on today's date)
-        # Prefix with _ to hide from frappe-gantt (it uses task properties for CSS classes)
-        expected_progress = self._calculate_expected_progress(start_date, end_date)
-        if expected_progress is not None:
-            task['_expected_progress'] = expected_progress
+    def _format_group_column(self, values: pd.Series) -> List[Optional[str]]:
+        """
+        Format a group-by column: stripped strings, None for nulls.
 
-        # Add progress if column specified
-        if self.config.progress_column:
-            progress = self._extract_progress(row[self.config.progress_column])
-            if progress is not None:
-                task['progress'] = progress
+        Args:
+            values: Group column from DataFrame (valid rows only)
 
-        # Add dependencies if column specified
-        # Store both CSS-safe IDs (for internal use) and display values (for tooltips)
-        if self.config.dependencies_column:
-            raw_value = row[self.config.dependencies_column]
-            deps = self._extract_dependencies(raw_value)
-            task['dependencies'] = [d.strip() for d in deps.split(',') if d.strip()] if deps else []
+        Returns:
+            List of group values aligned with values
+        """
+        text = values.astype(object).astype(str).str.strip()
+        return text.astype(object).where(values.notna(), None).tolist()
 
-            # Store original dependency string for display
-            if not pd.isna(raw_value) and str(raw_value).strip():
-                task['_display_dependencies'] = str(raw_value).strip()
-            else:
-                task['_display_dependencies'] = ''
+    def _materialize_tasks(self, fields: Dict[str, List[Any]], count: int) -> List[Dict[str, Any]]:
+        """
+        Zip per-field task columns into task dictionaries.
 
-        # Add color class based on color column OR progress-based default
-        if self.config.color_column and color_mapping:
-            color_value = row[self.config.color_column]
-            color_class = get_task_color_class(color_value, color_mapping)
-            task['custom_class'] = color_class
-        else:
-            # No color column: use default gray bar with progress-based overlay color
-            # Single class (no spaces) - Frappe Gantt uses classList.add() which rejects whitespace
-            progress = task.get('progress', 0) or 0
-            progress_tier = self._get_progress_tier(progress)
-            task['custom_class'] = f'bar-default-tier-{progress_tier}'
+        Optional keys are only set where they have a value, matching what
+        frappe-gantt and the frontend expect. Keys prefixed with _ are
+        hidden from frappe-gantt (it uses task properties for CSS classes).
 
-        # Add completion flag for all palettes (#31 - completion indicator)
-        task_progress = task.get('progress', 0) or 0
-        task['_is_complete'] = (task_progress == 100)
+        Args:
+            fields: Task field name -> list of values, one per task
+            count: Number of tasks
 
-        # Add custom tooltip fields
-        if self.config.tooltip_columns:
-            custom_fields = []  # Use list to preserve order explicitly
-            cols = self.config.tooltip_columns
-            if isinstance(cols, str):
-                cols = [cols]
-
-            for col in cols:
-                if col in row.index:
-                    val = row[col]
-                    # Format value (handle null, dates, numbers)
-                    if pd.isna(val):
-                        formatted_val = None  # Will be handled by frontend as "-"
-                    elif hasattr(val, 'strftime'):
-                        formatted_val = val.strftime('%Y-%m-%d')
-                    elif isinstance(val, (int, float)):
-                        # Preserve numeric types for display
-                        if pd.isna(val):
-                            formatted_val = None
-                        else:
-                            formatted_val = val
-                    else:
-                        formatted_val = str(val).strip()
-
-                    custom_fields.append({
-                        'label': col,
-                        'value': formatted_val
-                    })
-
-            if custom_fields:
-                task['custom_fields'] = custom_fields
-
-        # Add group column values for hierarchical sorting
-        if self.config.group_by_columns:
-            group_values = {}
-            for col in self.config.group_by_columns:
-                if col in row.index:
-                    val = row[col]
-                    if pd.isna(val):
-                        group_values[col] = None
-                    else:
-                        group_values[col] = str(val).strip()
-            if group_values:
-                task['_group_values'] = group_values
-
-        return task
-
-    def _extract_progress(self, value: Any) -> Optional[int]:
-        """
-        Extract and validate progress value (0-100).
+        Returns:
+            List of task dictionaries
+        """
+        # Bind every field list to a local once; the loop below only indexes locals
+        ids = fields['id']
+        display_ids = fields['_display_id']
+        names = fields['name']
+        starts = fields['start']
+        ends = fields['end']
+        expected_progress = fields['_expected_progress']
+        progress = fields['progress']
+        dependencies = fields.get('dependencies')
+        display_dependencies = fields.get('_display_dependencies')
+        custom_classes = fields['custom_class']
+        is_complete = fields['_is_complete']
+        custom_fields = fields.get('custom_fields')
+        group_values = fields.get('_group_values')
+
+        # Task count is known from the validity masks: allocate the list once
+        tasks = [None] * count
+        for i in range(count):
+            task = {
+                'id': ids[i],
+                '_display_id': display_ids[i],  # Original ID for tooltip display
+                'name': names[i],
+                'start': starts[i],
+                'end': ends[i],
+                'custom_class': custom_classes[i],
+                '_is_complete': is_complete[i]
+            }
+            # Optional keys are added after the literal
+            if expected_progress[i] is not None:
+                task['_expected_progress'] = expected_progress[i]
+            if progress[i] is not None:
+                task['progress'] = progress[i]
+            if dependencies is not None:
+                task['dependencies'] = dependencies[i]
+                task['_display_dependencies'] = display_dependencies[i]
+            if custom_fields is not None:
+                task['custom_fields'] = custom_fields[i]
+            if group_values is not None:
+                task['_group_values'] = group_values[i]
+            tasks[i] = task
+        return tasks
+
+    def _format_tooltip_column(self, values: pd.Series) -> List[Any]:
+        """
+        Format a tooltip column for display.
 
         Args:
-            value: Progress value from DataFrame
+            values: Tooltip column from DataFrame
 
         Returns:
-            Integer 0-100 or None if invalid
+            List aligned with values: None for nulls (frontend shows "-"),
+            YYYY-MM-DD for dates, numbers as-is, everything else as a
+            stripped string
         """
-        if pd.isna(value):
-            return None
+        # Datetime columns are formatted in one vectorized strftime pass
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            return parse_dates_to_iso(values).tolist()
+
+        # Low-cardinality string columns (assignee, priority, ...): strip each
+        # distinct value once and share that one str object across rows
+        if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            codes, uniques = values.factorize()
+            if len(uniques) < len(values) / 2:
+                # Trailing None absorbs the -1 code factorize assigns to nulls
+                lookup = np.array([value.strip() for value in uniques] + [None], dtype=object)
+                return lookup[codes].tolist()
+
+        # Nulls become None for the whole column at once
+        cleaned = values.astype(object).where(values.notna(), None).tolist()
+
+        # Numeric columns need no per-value formatting
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            return cleaned
+
+        formatted = []
+        for val in cleaned:
+            if val is None or isinstance(val, (int, float)):
+                # Preserve numeric types for display
+                formatted.append(val)
+            elif hasattr(val, 'strftime'):
+                formatted.append(val.strftime('%Y-%m-%d'))
+            else:
+                formatted.append(str(val).strip())
+        return formatted
 
-        try:
-            progress = int(float(value))
-            # Clamp to [0, 100]
-            progress = max(0, min(100, progress))
-            return progress
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid progress value: {value}. Using None.")
-            return None
+    def _extract_progress(self, values: pd.Series) -> List[Optional[int]]:
+        """
+        Extract and validate progress values (0-100) for a whole column.
+
+        Values are coerced with pd.to_numeric, then truncated and clamped
+        by _clip_progress(). Nulls and non-numeric values become None.
+
+        Args:
+            values: Progress column from DataFrame
+
+        Returns:
+            List aligned with values: integer 0-100 or None if invalid
+        """
+        numeric = pd.to_numeric(values, errors='coerce').astype(float)
+
+        invalid = numeric.isna() & values.notna()
+        if invalid.any():
+            logger.warning(
+                f"Invalid progress values: {values[invalid].unique()[:5].tolist()}. Using None."
+            )
+
+        progress, valid = _clip_progress(numeric.to_numpy(dtype=np.float64))
+        cleaned = progress.astype(object)
+        cleaned[~valid] = None
+        return cleaned.tolist()
 
     def _get_progress_tier(self, progress: int) -> int:
         """
@@ -520,38 +875,59 @@ class TaskTransformer:
         """
         if pd.isna(value):
             return ''
+        try:
+            return _normalize_hashable_id(value)
+        except TypeError:
+            # Unhashable values skip the cache
+            return _normalize_hashable_id.__wrapped__(value)
 
-        # Handle numeric types - convert whole number floats to int representation
-        # This solves the Pandas type mismatch where:
-        # - ID column (no NaNs): read as int64 → 277 → "277"
-        # - Dependency column (has NaNs): read as float64 → 276.0 → "276.0"
-        # We normalize both to "276" so they match
-        if isinstance(value, float):
-            # Check if it's a whole number (e.g., 276.0)
-            if value.is_integer():
-                return str(int(value))
-            else:
-                # Non-integer float (e.g., 54.8) - make CSS-safe
-                return self._make_css_safe(str(value).strip())
-
-        # For strings, also check if they look like whole-number floats
-        # This handles "1.0" -> "1" for dependency strings like "1.0, 2.0"
-        if isinstance(value, str):
-            stripped = value.strip()
-            try:
-                float_val = float(stripped)
-                if float_val.is_integer():
-                    return str(int(float_val))
-                else:
-                    # Non-integer float string - make CSS-safe
-                    return self._make_css_safe(stripped)
-            except (ValueError, TypeError):
-                pass
-            # General string - make CSS-safe
-            return self._make_css_safe(stripped)
-
-        # For all other types (int, Decimal, etc.), convert directly
-        return self._make_css_safe(str(value).strip())
+    def _normalize_id_series(self, values: pd.Series) -> np.ndarray:
+        """
+        Normalize a whole column of ID values, matching _normalize_id().
+
+        Dispatches on the column dtype once: integer and float columns are
+        formatted with vectorized NumPy ops and string columns normalize each
+        distinct value once. Mixed object columns fall back to _normalize_id()
+        per value.
+
+        Args:
+            values: ID values (column from DataFrame or exploded dependencies)
+
+        Returns:
+            Object array of normalized, CSS-safe ID strings aligned with values
+        """
+        kind = values.dtype.kind
+
+        if kind in 'iu':
+            # copy=True: under Copy-on-Write to_numpy() may return a read-only view
+            normalized = values.astype(str).to_numpy(dtype=object, copy=True)
+            normalized[values.isna().to_numpy()] = ''
+            return normalized
+
+        if kind == 'f':
+            as_float = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            normalized = np.full(len(as_float), '', dtype=object)
+            whole = np.isfinite(as_float) & (as_float == np.trunc(as_float))
+            fits_int64 = whole & (np.abs(as_float) < 2.0 ** 63)
+            normalized[fits_int64] = as_float[fits_int64].astype(np.int64).astype(str).tolist()
+            huge = whole & ~fits_int64
+            normalized[huge] = [str(int(v)) for v in as_float[huge].tolist()]
+            # Float repr only contains digits, '-', 'e' and '.', so the
+            # period is the one character _make_css_safe() would encode
+            decimal = ~whole & ~np.isnan(as_float)
+            if decimal.any():
+                normalized[decimal] = np.char.replace(
+                    as_float[decimal].astype(str), '.', '_x2e_'
+                ).tolist()
+            return normalized
+
+        if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            codes, uniques = values.factorize()
+            # Trailing '' absorbs the -1 code factorize assigns to nulls
+            lookup = np.array([self._normalize_id(v) for v in uniques] + [''], dtype=object)
+            return lookup[codes]
+
+        return np.array([self._normalize_id(v) for v in values.tolist()], dtype=object)
 
     def _make_css_safe(self, value: str) -> str:
         """
@@ -576,55 +952,47 @@ class TaskTransformer:
         Returns:
             CSS-safe string with non-alphanumeric chars hex-encoded
         """
-        def encode_char(match: re.Match) -> str:
-            return f'_x{ord(match.group(0)):02x}_'
-
-        # Keep alphanumerics, underscores, and hyphens (CSS-safe)
-        # Encode everything else as _xHH_ where HH is the hex code
-        return re.sub(r'[^a-zA-Z0-9_-]', encode_char, value)
+        return _CSS_UNSAFE_RE.sub(_encode_css_char, value)
 
-    def _extract_dependencies(self, value: Any) -> str:
+    def _extract_dependencies(self, values: pd.Series) -> Tuple[List[List[str]], List[str]]:
         """
-        Extract dependencies as comma-separated string.
-        Uses _normalize_id() to ensure dependency IDs match task IDs exactly.
+        Extract dependencies for a whole column.
+        Uses _normalize_id_series() to ensure dependency IDs match task IDs exactly.
+
+        Splitting and whitespace stripping run through the pandas .str
+        accessor over the exploded column. This handles both "50" and
+        "50,51,52" and "1.0, 2.0" formats.
 
         Args:
-            value: Dependencies value from DataFrame (can be str, int, float, etc.)
+            values: Dependencies column from DataFrame (can be str, int, float, etc.)
 
         Returns:
-            Comma-separated string of task IDs, or empty string
+            Tuple of (dependency ID lists, display strings), aligned with values.
+            Null or blank values give [] and ''.
         """
-        # Handle NaN, None, or empty string
-        if pd.isna(value):
-            return ''
-
         # Convert to string first (handles numeric single values)
-        value_str = str(value).strip()
+        text = values.astype(object).astype(str).str.strip().where(values.notna(), '')
+        text = text.reset_index(drop=True)
 
-        # Check if empty
-        if not value_str:
-            return ''
+        # One part per (row, dependency), keeping the row position as index
+        parts = text.str.split(',').explode().str.strip()
+        parts = parts[parts != '']
 
-        # Split by comma, normalize each part
-        # This handles both "50" and "50,51,52" and "1.0, 2.0" formats
-        if ',' in value_str:
-            # Multiple dependencies - normalize each individual one
-            deps_list = []
-            for d in value_str.split(','):
-                d = d.strip()
-                if d:
-                    # Normalize each dependency ID (handles '1.0' -> '1')
-                    deps_list.append(self._normalize_id(d))
-            return ','.join(deps_list) if deps_list else ''
-        else:
-            # Single dependency - normalize it
-            return self._normalize_id(value_str)
+        # explode() keeps parts in row order, so each row's dependencies are
+        # one contiguous slice of the flat normalized list
+        flat = self._normalize_id_series(parts).tolist()
+        ends = np.cumsum(np.bincount(parts.index.to_numpy(dtype=np.int64), minlength=len(text)))
+        starts = np.concatenate(([0], ends[:-1]))
+        dependencies = [flat[a:b] for a, b in zip(starts.tolist(), ends.tolist())]
 
-    def _increment_skip_reason(self, reason: str) -> None:
-        """Increment skip reason counter."""
-        self.stats['skip_reasons'][reason] = self.stats['skip_reasons'].get(reason, 0) + 1
+        return dependencies, text.tolist()
 
-    def _calculate_expected_progress(self, start_date: str, end_date: str) -> Optional[float]:
+    def _calculate_expected_progress(
+        self,
+        start_date: str,
+        end_date: str,
+        today: Optional[date] = None
+    ) -> Optional[float]:
         """
         Calculate expected progress based on current date.
 
@@ -634,6 +1002,8 @@ class TaskTransformer:
         Args:
             start_date: Task start date in YYYY-MM-DD format
             end_date: Task end date in YYYY-MM-DD format
+            today: Reference date (defaults to _today()); transform() reads
+                the clock once and passes it for every task
 
         Returns:
             Expected progress percentage (0-100), or None if:
@@ -642,7 +1012,8 @@ class TaskTransformer:
             - Dates are invalid
         """
         try:
-            today = date.today()
+            if today is None:
+                today = _today()
             start = datetime.strptime(start_date, '%Y-%m-%d').date()
             end = datetime.strptime(end_date, '%Y-%m-%d').date()
 
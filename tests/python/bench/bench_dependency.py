@@ -0,0 +1,124 @@
+"""
+Scaling benchmarks for dependency validation, topological sort, and grouping.
+
+Unit tests only cover 3-5 task graphs, so they never see an O(N^2) regression.
+These cases run the same code at N in {100, 1k, 10k, 100k}.
+
+Run with: pytest tests/python/bench --benchmark-only
+"""
+
+import copy
+import random
+import time
+
+import pytest
+
+from ganttchart.dependency_validator import detect_and_break_cycles, validate_all_dependencies
+from ganttchart.sort_utils import sort_tasks, group_and_sort_tasks
+
+SIZES = [100, 1_000, 10_000, 100_000]
+
+
+def chain_tasks(n):
+    """Tasks 0 <- 1 <- ... <- n-1: one dependency chain, worst case for DFS depth."""
+    return [
+        {'id': str(i), 'start': '2024-01-01', 'end': '2024-01-02',
+         'dependencies': [str(i - 1)] if i else []}
+        for i in range(n)
+    ]
+
+
+def random_dag_tasks(n, max_deps=3, seed=42):
+    """Each task depends on up to max_deps earlier tasks, so the graph is acyclic."""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(n):
+        deps = {str(rng.randrange(i)) for _ in range(rng.randint(0, max_deps))} if i else set()
+        tasks.append({
+            'id': str(i),
+            'name': f'Task {i}',
+            'start': f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'end': '2025-01-01',
+            'dependencies': sorted(deps),
+            '_group_values': {'Region': f'R{rng.randrange(5)}', 'Team': f'T{rng.randrange(20)}'}
+        })
+    return tasks
+
+
+def ring_tasks(n):
+    """Chain with a back edge from the head to the tail: exactly one cycle."""
+    tasks = chain_tasks(n)
+    tasks[0]['dependencies'] = [str(n - 1)]
+    return tasks
+
+
+@pytest.mark.benchmark(group='cycles-chain')
+@pytest.mark.parametrize('n', SIZES)
+def bench_detect_cycles_chain(benchmark, n):
+    tasks = chain_tasks(n)
+    _, warnings = benchmark(detect_and_break_cycles, tasks)
+    assert warnings == []
+
+
+@pytest.mark.benchmark(group='cycles-dag')
+@pytest.mark.parametrize('n', SIZES)
+def bench_detect_cycles_random_dag(benchmark, n):
+    tasks = random_dag_tasks(n)
+    _, warnings = benchmark(detect_and_break_cycles, tasks)
+    assert warnings == []
+
+
+@pytest.mark.benchmark(group='cycles-ring')
+@pytest.mark.parametrize('n', SIZES)
+def bench_detect_cycles_ring(benchmark, n):
+    # Breaking the cycle mutates the tasks, so every round gets a fresh copy
+    template = ring_tasks(n)
+    _, warnings = benchmark.pedantic(
+        detect_and_break_cycles,
+        setup=lambda: ((copy.deepcopy(template),), {}),
+        rounds=3
+    )
+    assert len(warnings) == 1
+
+
+@pytest.mark.benchmark(group='validate-all')
+@pytest.mark.parametrize('n', SIZES)
+def bench_validate_all_dependencies(benchmark, n):
+    tasks = random_dag_tasks(n)
+    benchmark(validate_all_dependencies, tasks)
+
+
+@pytest.mark.benchmark(group='topological-sort')
+@pytest.mark.parametrize('n', SIZES)
+def bench_topological_sort(benchmark, n):
+    tasks = random_dag_tasks(n)
+    result = benchmark(sort_tasks, tasks, 'dependencies')
+    assert len(result) == n
+
+
+@pytest.mark.benchmark(group='grouping')
+@pytest.mark.parametrize('n', SIZES)
+def bench_group_and_sort(benchmark, n):
+    tasks = random_dag_tasks(n)
+    result = benchmark(group_and_sort_tasks, tasks, ['Region', 'Team'], 'start_asc')
+    assert len(result) == n
+
+
+@pytest.mark.benchmark(group='scaling')
+def bench_cycle_detection_scales_linearly(benchmark):
+    """10x more tasks must cost well under 100x the time (quadratic growth)."""
+    small = chain_tasks(1_000)
+    large = chain_tasks(10_000)
+    small_time = min(_timed(detect_and_break_cycles, small) for _ in range(5))
+
+    benchmark(detect_and_break_cycles, large)
+
+    # Timed by hand: benchmark.stats is None under --benchmark-disable
+    large_time = min(_timed(detect_and_break_cycles, large) for _ in range(3))
+    assert large_time < small_time * 30
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
@@ -5,7 +5,26 @@ Test fixtures for Gantt chart plugin unit tests.
 import pytest
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from datetime import date, datetime
+
+# Copy-on-Write is always on from pandas 3.0; opt in on 2.x so shared
+# fixtures are handed out as views that only copy when written
+if int(pd.__version__.split('.')[0]) == 2:
+    pd.set_option('mode.copy_on_write', True)
+
+
+def pytest_addoption(parser):
+    parser.addoption('--runslow', action='store_true', default=False, help='run tests marked slow')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow-marked tests unless --runslow is given."""
+    if config.getoption('--runslow'):
+        return
+    skip_slow = pytest.mark.skip(reason='needs --runslow')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture
@@ -35,18 +54,23 @@ def edge_case_df():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def large_df():
-    """Large DataFrame for performance testing."""
+    """
+    Large DataFrame for performance testing.
+
+    Built once per session with explicit compact dtypes; tests must not
+    mutate it.
+    """
     size = 2000
     return pd.DataFrame({
-        'id': range(size),
+        'id': np.arange(size, dtype=np.int64),
         'name': [f'Task {i}' for i in range(size)],
         'start': ['2024-01-01'] * size,
         'end': ['2024-01-05'] * size,
-        'progress': [i % 101 for i in range(size)],
+        'progress': (np.arange(size) % 101).astype(np.int8),
         'deps': [''] * size,
-        'category': [f'Cat{i % 5}' for i in range(size)]
+        'category': pd.Categorical([f'Cat{i % 5}' for i in range(size)])
     })
 
 
@@ -64,8 +88,8 @@ def circular_dependency_tasks():
 def self_dependency_tasks():
     """Tasks with self-dependencies."""
     return [
-        {'id': 'A', 'name': 'Task A', 'start': '2024-01-01', 'end': '2024-01-05', 'dependencies': ['A']},
-        {'id': 'B', 'name': 'Task B', 'start': '2024-01-06', 'end': '2024-01-10', 'dependencies': ['B', 'A']}
+        {'id': 'A', 'name': 'Task A', 'start': '2024-01-01', 'end': '2024-01-05', 'dependencies': ('A',)},
+        {'id': 'B', 'name': 'Task B', 'start': '2024-01-06', 'end': '2024-01-10', 'dependencies': ('B', 'A')}
     ]
 
 
@@ -73,8 +97,8 @@ def self_dependency_tasks():
 def missing_reference_tasks():
     """Tasks with dependencies referencing non-existent tasks."""
     return [
-        {'id': 'A', 'name': 'Task A', 'start': '2024-01-01', 'end': '2024-01-05', 'dependencies': ['B', 'C']},
-        {'id': 'B', 'name': 'Task B', 'start': '2024-01-06', 'end': '2024-01-10', 'dependencies': ['D']}
+        {'id': 'A', 'name': 'Task A', 'start': '2024-01-01', 'end': '2024-01-05', 'dependencies': ('B', 'C')},
+        {'id': 'B', 'name': 'Task B', 'start': '2024-01-06', 'end': '2024-01-10', 'dependencies': ('D',)}
     ]
 
 
@@ -92,3 +116,42 @@ def sample_transformer_config():
         color_column='category',
         max_tasks=1000
     )
+
+
+@pytest.fixture(scope='session')
+def make_transformer():
+    """
+    Factory building a TaskTransformer over the id/name/start/end columns.
+
+    Keyword arguments override or extend the baseline config, e.g.
+    make_transformer(progress_column='progress').
+    """
+    from ganttchart.task_transformer import TaskTransformer, TaskTransformerConfig
+
+    baseline = {
+        'id_column': 'id',
+        'name_column': 'name',
+        'start_column': 'start',
+        'end_column': 'end',
+    }
+
+    def _make(**overrides):
+        return TaskTransformer(TaskTransformerConfig(**{**baseline, **overrides}))
+
+    return _make
+
+
+@pytest.fixture(scope='module')
+def shared_transformer(make_transformer):
+    """Baseline TaskTransformer shared by tests of its stateless helpers."""
+    return make_transformer()
+
+
+FROZEN_TODAY = date(2024, 6, 15)
+
+
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """Pin the transformer's notion of today to FROZEN_TODAY."""
+    monkeypatch.setattr('ganttchart.task_transformer._today', lambda: FROZEN_TODAY)
+    return FROZEN_TODAY
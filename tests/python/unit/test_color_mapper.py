@@ -6,7 +6,7 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from ganttchart.color_mapper import create_color_mapping, get_task_color_class, get_color_mapping_summary, COLOR_PALETTE, DEFAULT_COLOR
+from ganttchart.color_mapper import create_color_mapping, get_task_color_class, get_task_color_classes, get_color_mapping_summary, COLOR_PALETTE, DEFAULT_COLOR
 
 
 class TestCreateColorMapping:
@@ -121,6 +121,28 @@ class TestGetTaskColorClass:
         assert get_task_color_class(3, mapping) == DEFAULT_COLOR
 
 
+class TestGetTaskColorClasses:
+    """Tests for get_task_color_classes column function."""
+
+    def test_matches_scalar_lookup(self):
+        """Test column lookup agrees with get_task_color_class value by value."""
+        values = pd.Series(['Dev', 'QA', None, 'Unknown', np.nan, 'Dev'])
+        mapping = create_color_mapping(pd.DataFrame({'c': values}), 'c')
+        expected = [get_task_color_class(v, mapping) for v in values]
+        assert list(get_task_color_classes(values, mapping)) == expected
+
+    def test_numeric_column(self):
+        """Test numeric column with NaN."""
+        values = pd.Series([1.0, np.nan, 2.0])
+        result = get_task_color_classes(values, {1.0: 'bar-blue', 2.0: 'bar-green'})
+        assert list(result) == ['bar-blue', DEFAULT_COLOR, 'bar-green']
+
+    def test_empty_mapping(self):
+        """Test empty mapping returns default for every row."""
+        result = get_task_color_classes(pd.Series(['A', 'B']), {})
+        assert list(result) == [DEFAULT_COLOR, DEFAULT_COLOR]
+
+
 class TestGetColorMappingSummary:
     """Tests for get_color_mapping_summary function."""
 
@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
-from ganttchart.date_parser import parse_date_to_iso, validate_date_range, _validate_date_string, _try_parse_unix_timestamp
+from ganttchart.date_parser import parse_date_to_iso, parse_dates_to_iso, validate_date_range, _validate_date_string, _try_parse_unix_timestamp
 
 
 class TestParseDateToISO:
@@ -87,6 +87,42 @@ class TestParseDateToISO:
         assert error is not None
 
 
+class TestParseDatesToISO:
+    """Tests for parse_dates_to_iso column function."""
+
+    def test_mixed_object_column_matches_scalar(self):
+        """Test column parsing agrees with parse_date_to_iso value by value."""
+        values = pd.Series([
+            "2024-01-15", None, "2024-01-15", pd.Timestamp("2024-02-01"),
+            1704067200, "not-a-date", np.nan, "2024-02-30"
+        ], dtype=object)
+        expected = [parse_date_to_iso(v)[0] for v in values]
+        assert list(parse_dates_to_iso(values)) == expected
+
+    def test_string_column_matches_scalar(self):
+        """Test the fixed-format fast path agrees with parse_date_to_iso."""
+        values = pd.Series([
+            "2024-01-15", "2024-02-29", "2023-02-29", "2024-1-5", " 2024-01-15",
+            "2024-01-15T08:00:00", "Jan 15, 2024", "0001-01-01", "2024-01-15\n", None
+        ], dtype=object)
+        expected = [parse_date_to_iso(v)[0] for v in values]
+        assert list(parse_dates_to_iso(values)) == expected
+
+    def test_datetime_column(self):
+        """Test datetime64 column (with NaT) is formatted directly."""
+        values = pd.Series(pd.to_datetime(["2024-01-15 10:30", None]))
+        assert list(parse_dates_to_iso(values)) == ["2024-01-15", None]
+
+    def test_tz_aware_column(self):
+        """Test timezone-aware column keeps its local calendar date."""
+        values = pd.Series(pd.to_datetime(["2024-01-15 23:00"]).tz_localize("US/Eastern"))
+        assert list(parse_dates_to_iso(values)) == ["2024-01-15"]
+
+    def test_empty_column(self):
+        """Test empty column returns empty array."""
+        assert len(parse_dates_to_iso(pd.Series([], dtype=object))) == 0
+
+
 class TestValidateDateRange:
     """Tests for validate_date_range function."""
 
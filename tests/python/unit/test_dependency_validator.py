@@ -2,6 +2,8 @@
 Unit tests for dependency_validator module.
 """
 
+import re
+
 import pytest
 
 from ganttchart.dependency_validator import (
@@ -12,6 +14,10 @@ from ganttchart.dependency_validator import (
     _build_adjacency_list
 )
 
+_CYCLE_RE = re.compile(r'circular|cycle', re.IGNORECASE)
+_MISSING_REF_RE = re.compile(r'non-existent')
+_SELF_DEP_RE = re.compile(r'self-dependency')
+
 
 class TestDetectAndBreakCycles:
     """Tests for detect_and_break_cycles function."""
@@ -23,15 +29,14 @@ class TestDetectAndBreakCycles:
         original_tasks = copy.deepcopy(circular_dependency_tasks)
 
         result, warnings = detect_and_break_cycles(circular_dependency_tasks)
-        # Should generate a warning about the cycle
-        assert len(warnings) > 0
-        assert any('circular' in w.lower() or 'cycle' in w.lower() for w in warnings)
+        # Should generate a warning about the cycle (any() stops at first match)
+        assert any(_CYCLE_RE.search(w) for w in warnings)
         # Verify that at least one task now has empty or reduced dependencies
         # After breaking A→B→C→A, one edge should be removed
         empty_or_reduced = False
         for r_task, orig_task in zip(result, original_tasks):
             r_deps = r_task['dependencies'] if r_task['dependencies'] else []
-            o_deps = orig_task['dependencies'] if isinstance(orig_task['dependencies'], list) else ([d.strip() for d in orig_task['dependencies'].split(',') if d.strip()] if orig_task['dependencies'] else [])
+            o_deps = list(orig_task['dependencies']) if isinstance(orig_task['dependencies'], (list, tuple)) else ([d.strip() for d in orig_task['dependencies'].split(',') if d.strip()] if orig_task['dependencies'] else [])
             if len(r_deps) < len(o_deps):
                 empty_or_reduced = True
                 break
@@ -76,10 +81,10 @@ class TestDetectAndBreakCycles:
     def test_complex_cycle(self):
         """Test complex cycle with multiple nodes."""
         tasks = [
-            {'id': 'A', 'dependencies': ['B']},
-            {'id': 'B', 'dependencies': ['C']},
-            {'id': 'C', 'dependencies': ['D']},
-            {'id': 'D', 'dependencies': ['A']}  # Creates cycle: A→B→C→D→A
+            {'id': 'A', 'dependencies': ('B',)},
+            {'id': 'B', 'dependencies': ('C',)},
+            {'id': 'C', 'dependencies': ('D',)},
+            {'id': 'D', 'dependencies': ('A',)}  # Creates cycle: A→B→C→D→A
         ]
         result, warnings = detect_and_break_cycles(tasks)
         assert len(warnings) > 0
@@ -87,6 +92,16 @@ class TestDetectAndBreakCycles:
         total_deps = sum(len(t['dependencies']) if t['dependencies'] else 0 for t in result)
         assert total_deps < 4
 
+    def test_long_chain(self):
+        """Test that chains deeper than the recursion limit are handled."""
+        tasks = [
+            {'id': str(i), 'dependencies': [str(i - 1)] if i else []}
+            for i in range(5000)
+        ]
+        result, warnings = detect_and_break_cycles(tasks)
+        assert warnings == []
+        assert result[-1]['dependencies'] == ['4998']
+
 
 class TestValidateDependencyReferences:
     """Tests for validate_dependency_references function."""
@@ -94,9 +109,9 @@ class TestValidateDependencyReferences:
     def test_valid_references(self):
         """Test tasks with valid dependency references."""
         tasks = [
-            {'id': 'A', 'dependencies': []},
-            {'id': 'B', 'dependencies': ['A']},
-            {'id': 'C', 'dependencies': ['A', 'B']}
+            {'id': 'A', 'dependencies': ()},
+            {'id': 'B', 'dependencies': ('A',)},
+            {'id': 'C', 'dependencies': ('A', 'B')}
         ]
         result, warnings = validate_dependency_references(tasks)
         assert len(warnings) == 0
@@ -114,14 +129,22 @@ class TestValidateDependencyReferences:
         task_b = next(t for t in result if t['id'] == 'B')
         assert task_b['dependencies'] == []
 
+    def test_other_ids_are_valid(self):
+        """Test references to tasks outside the list (e.g. past maxTasks) are kept."""
+        tasks = [{'id': 'A', 'dependencies': ('B', 'C')}]
+        result, warnings = validate_dependency_references(tasks, other_ids={'B'})
+        assert result[0]['dependencies'] == ['B']
+        assert len(warnings) == 1 and 'C' in warnings[0]
+
     def test_self_dependency_removal(self):
         """Test removal of self-dependencies."""
         tasks = [
-            {'id': 'A', 'dependencies': ['A']},
-            {'id': 'B', 'dependencies': ['A', 'B', 'C']}
+            {'id': 'A', 'dependencies': ('A',)},
+            {'id': 'B', 'dependencies': ('A', 'B', 'C')}
         ]
         result, warnings = validate_dependency_references(tasks)
-        assert len(warnings) >= 2
+        assert any(_SELF_DEP_RE.search(w) for w in warnings)
+        assert any(_MISSING_REF_RE.search(w) for w in warnings)
         task_a = next(t for t in result if t['id'] == 'A')
         assert task_a['dependencies'] == []
         task_b = next(t for t in result if t['id'] == 'B')
@@ -144,13 +167,14 @@ class TestValidateAllDependencies:
     def test_combined_validation(self):
         """Test combined reference and cycle validation."""
         tasks = [
-            {'id': 'A', 'dependencies': ['B', 'D']},  # D doesn't exist
-            {'id': 'B', 'dependencies': ['C']},
-            {'id': 'C', 'dependencies': ['A']}  # Creates cycle: A→B→C→A
+            {'id': 'A', 'dependencies': ('B', 'D')},  # D doesn't exist
+            {'id': 'B', 'dependencies': ('C',)},
+            {'id': 'C', 'dependencies': ('A',)}  # Creates cycle: A→B→C→A
         ]
         result, warnings = validate_all_dependencies(tasks)
         # Should have warnings for both missing reference and cycle
-        assert len(warnings) >= 2
+        assert any(_MISSING_REF_RE.search(w) for w in warnings)
+        assert any(_CYCLE_RE.search(w) for w in warnings)
         # D should be removed (doesn't exist)
         task_a = next(t for t in result if t['id'] == 'A')
         assert 'D' not in task_a['dependencies']
@@ -197,9 +221,9 @@ class TestCountDependencies:
     def test_basic_count(self):
         """Test basic dependency counting."""
         tasks = [
-            {'id': 'A', 'dependencies': []},
-            {'id': 'B', 'dependencies': ['A']},
-            {'id': 'C', 'dependencies': ['A', 'B']}
+            {'id': 'A', 'dependencies': ()},
+            {'id': 'B', 'dependencies': ('A',)},
+            {'id': 'C', 'dependencies': ('A', 'B')}
         ]
         counts = count_dependencies(tasks)
         assert counts['total_tasks'] == 3
@@ -0,0 +1,253 @@
+"""
+Unit tests for filters module.
+"""
+
+import random
+from functools import reduce
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from ganttchart import filters as filters_module
+from ganttchart.filters import apply_dataiku_filters, filter_chunks
+
+
+def sequential_filters(df, filters):
+    """
+    Reference: the original sequential implementation of the filters.
+
+    Each filter is applied to the output of the previous one; a filter that
+    fails is skipped. Kept here as the parity oracle for the compiled plan.
+    """
+    def numerical_filter(df, filter):
+        conditions = []
+        if filter.get("minValue"):
+            conditions.append(df[filter['column']] >= filter['minValue'])
+        if filter.get("maxValue"):
+            conditions.append(df[filter['column']] <= filter['maxValue'])
+        return conditions
+
+    def alphanum_filter(df, filter):
+        conditions = []
+        excluded_values = []
+        for k, v in filter.get('excludedValues', {}).items():
+            if k != '___dku_no_value___':
+                if v:
+                    excluded_values.append(k)
+            else:
+                if v:
+                    conditions.append(~df[filter['column']].isnull())
+        if excluded_values:
+            if filter.get('columnType') == 'NUMERICAL':
+                excluded_values = [float(x) for x in excluded_values]
+            conditions.append(~df[filter['column']].isin(excluded_values))
+        return conditions
+
+    def date_filter(df, filter):
+        if filter.get("dateFilterType") == "RANGE":
+            conditions = []
+            if filter.get("minValue"):
+                conditions.append(df[filter['column']] >= pd.Timestamp(filter['minValue'], unit='ms'))
+            if filter.get("maxValue"):
+                conditions.append(df[filter['column']] <= pd.Timestamp(filter['maxValue'], unit='ms'))
+            return conditions
+
+        excluded_values = [k for k, v in filter.get('excludedValues', {}).items() if v]
+        if not excluded_values:
+            return []
+        dt = df[filter['column']].dt
+        shifted = [int(k) + 1 for k in excluded_values]
+        components = {
+            "YEAR": (lambda: dt.year, excluded_values),
+            "QUARTER_OF_YEAR": (lambda: dt.quarter, shifted),
+            "MONTH_OF_YEAR": (lambda: dt.month, shifted),
+            "WEEK_OF_YEAR": (lambda: dt.isocalendar().week, shifted),
+            "DAY_OF_MONTH": (lambda: dt.day, shifted),
+            "DAY_OF_WEEK": (lambda: dt.dayofweek, excluded_values),
+            "HOUR_OF_DAY": (lambda: dt.hour, excluded_values),
+        }
+        component = components.get(filter.get("dateFilterType"))
+        if component is None:
+            return []
+        values, keys = component
+        return [~values().isin(keys)]
+
+    handlers = {
+        "NUMERICAL_FACET": numerical_filter,
+        "ALPHANUM_FACET": alphanum_filter,
+        "DATE_FACET": date_filter,
+    }
+    for f in filters:
+        handler = handlers.get(f.get("filterType"))
+        if handler is None:
+            continue
+        try:
+            conditions = handler(df, f)
+            if conditions:
+                df = df[reduce(lambda c1, c2: c1 & c2, conditions)]
+        except Exception:
+            pass
+
+    if df.empty:
+        raise ValueError("DataFrame is empty after filtering")
+    return df
+
+
+def random_filter(rng):
+    """Build one random filter over the filter_df columns."""
+    kind = rng.choice(['numerical', 'alphanum', 'date_part', 'date_range', 'unknown'])
+    if kind == 'numerical':
+        return {
+            'filterType': 'NUMERICAL_FACET',
+            'column': rng.choice(['cost', 'missing']),
+            'minValue': rng.choice([None, 0, 20]),
+            'maxValue': rng.choice([None, 70])
+        }
+    if kind == 'alphanum':
+        return {
+            'filterType': 'ALPHANUM_FACET',
+            'column': rng.choice(['team', 'level']),
+            'columnType': rng.choice([None, 'NUMERICAL']),
+            'excludedValues': {
+                key: rng.random() < 0.5
+                for key in rng.sample(['Dev', 'QA', '1', '3', '___dku_no_value___'], 3)
+            }
+        }
+    if kind == 'date_part':
+        return {
+            'filterType': 'DATE_FACET',
+            'column': 'start',
+            'dateFilterType': rng.choice(list(filters_module.DATE_PART_FILTERS)),
+            'excludedValues': {str(k): rng.random() < 0.4 for k in range(12)}
+        }
+    if kind == 'date_range':
+        return {
+            'filterType': 'DATE_FACET',
+            'column': 'start',
+            'dateFilterType': 'RANGE',
+            'minValue': rng.choice([None, 1704067200000]),   # 2024-01-01
+            'maxValue': rng.choice([None, 1719792000000])    # 2024-07-01
+        }
+    return {'filterType': 'CUSTOM', 'column': 'team'}
+
+
+def filtered_index(apply, df, filters):
+    """Return the surviving row labels, or None if every row was removed."""
+    try:
+        return apply(df, filters).index.tolist()
+    except ValueError:
+        return None
+
+
+@pytest.fixture(scope='module')
+def filter_df():
+    """Frame covering the column kinds the facets filter on."""
+    rng = np.random.RandomState(7)
+    n = 120
+    df = pd.DataFrame({
+        'cost': rng.randint(0, 100, n).astype(float),
+        'team': rng.choice(['Dev', 'QA', 'Ops'], n).astype(object),
+        'level': rng.choice([1.0, 2.0, 3.0], n),
+        'start': pd.Timestamp('2023-06-01') + pd.to_timedelta(rng.randint(0, 500 * 24, n), unit='h')
+    })
+    df.loc[::9, 'team'] = None
+    df.loc[::11, 'level'] = np.nan
+    df.loc[::13, 'start'] = pd.NaT
+    return df
+
+
+class TestApplyDataikuFilters:
+    """Tests for apply_dataiku_filters function."""
+
+    def test_matches_sequential_filters(self, filter_df):
+        """Test random filter combinations keep the same rows as the original."""
+        rng = random.Random(0)
+        for _ in range(100):
+            filters = [random_filter(rng) for _ in range(rng.randint(0, 4))]
+            assert filtered_index(apply_dataiku_filters, filter_df, filters) == \
+                filtered_index(sequential_filters, filter_df, filters), filters
+
+    def test_parallel_path_matches(self, filter_df, monkeypatch):
+        """Test the thread-pool path keeps the same rows as the inline path."""
+        filters = [
+            {'filterType': 'NUMERICAL_FACET', 'column': 'cost', 'minValue': 10},
+            {'filterType': 'ALPHANUM_FACET', 'column': 'team', 'excludedValues': {'QA': True}},
+            {'filterType': 'DATE_FACET', 'column': 'start', 'dateFilterType': 'MONTH_OF_YEAR',
+             'excludedValues': {'0': True, '5': True}},
+        ]
+        expected = apply_dataiku_filters(filter_df, filters).index.tolist()
+        monkeypatch.setattr(filters_module, 'PARALLEL_FILTER_MIN_ROWS', 0)
+        assert apply_dataiku_filters(filter_df, filters).index.tolist() == expected
+
+    def test_failing_filter_is_skipped(self, filter_df):
+        """Test a filter on a missing column is skipped, others still apply."""
+        filters = [
+            {'filterType': 'NUMERICAL_FACET', 'column': 'missing', 'minValue': 1},
+            {'filterType': 'NUMERICAL_FACET', 'column': 'cost', 'minValue': 50},
+        ]
+        result = apply_dataiku_filters(filter_df, filters)
+        assert (result['cost'] >= 50).all()
+
+    def test_all_rows_removed(self, filter_df):
+        """Test removing every row raises ValueError."""
+        filters = [{'filterType': 'NUMERICAL_FACET', 'column': 'cost', 'minValue': 1000}]
+        with pytest.raises(ValueError, match='empty after filtering'):
+            apply_dataiku_filters(filter_df, filters)
+
+
+class TestFilterChunks:
+    """Tests for filter_chunks function."""
+
+    @pytest.mark.parametrize('chunk_rows', [1, 17, 1000])
+    def test_matches_whole_frame(self, filter_df, chunk_rows):
+        """Test filtering chunk by chunk keeps the same rows as the whole frame."""
+        rng = random.Random(chunk_rows)
+        for _ in range(20):
+            filters = [random_filter(rng) for _ in range(rng.randint(1, 3))]
+            chunks = (filter_df.iloc[i:i + chunk_rows] for i in range(0, len(filter_df), chunk_rows))
+            assert filtered_index(lambda df, f: filter_chunks(chunks, f), filter_df, filters) == \
+                filtered_index(apply_dataiku_filters, filter_df, filters), filters
+
+    def test_all_rows_removed(self, filter_df):
+        """Test removing every row raises ValueError, as for a whole frame."""
+        filters = [{'filterType': 'NUMERICAL_FACET', 'column': 'cost', 'minValue': 1000}]
+        with pytest.raises(ValueError, match='empty after filtering'):
+            filter_chunks([filter_df.iloc[:60], filter_df.iloc[60:]], filters)
+
+
+class TestStringDateColumns:
+    """Tests for date filters on columns read as strings."""
+
+    @pytest.fixture
+    def mixed_df(self):
+        """Dates in two formats, plus a value that is not a date."""
+        return pd.DataFrame({'start': [
+            '2024-01-15', '2024-03-01', '2024/08/15 10:00', 'March 3, 2025', 'TBD', None
+        ]})
+
+    def test_range_filter_parses_mixed_formats(self, mixed_df, caplog):
+        """Test every format is compared and the non-date row is kept with a warning."""
+        filters = [{
+            'filterType': 'DATE_FACET',
+            'column': 'start',
+            'dateFilterType': 'RANGE',
+            'minValue': 1706745600000,   # 2024-02-01
+            'maxValue': 1735689600000    # 2025-01-01
+        }]
+        with caplog.at_level('WARNING', logger='ganttchart.filters'):
+            result = apply_dataiku_filters(mixed_df, filters)
+        assert result['start'].tolist() == ['2024-03-01', '2024/08/15 10:00', 'TBD']
+        assert '1 value(s) in column start are not dates' in caplog.text
+
+    def test_part_filter_keeps_unparsed_rows(self, mixed_df):
+        """Test a date-part filter excludes by every format and keeps non-dates."""
+        filters = [{
+            'filterType': 'DATE_FACET',
+            'column': 'start',
+            'dateFilterType': 'MONTH_OF_YEAR',
+            'excludedValues': {'2': True}   # March
+        }]
+        result = apply_dataiku_filters(mixed_df, filters)
+        assert result['start'].iloc[:3].tolist() == ['2024-01-15', '2024/08/15 10:00', 'TBD']
+        assert result['start'].iloc[3:].isna().all()
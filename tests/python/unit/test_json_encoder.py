@@ -0,0 +1,93 @@
+"""
+Unit tests for json_encoder module.
+"""
+
+import json
+import datetime
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from ganttchart.json_encoder import dumps, dumps_bytes, loads
+
+
+class TestDumps:
+    """Tests for dumps function."""
+
+    def test_plain_payload(self):
+        """Test plain Python payload round-trips."""
+        payload = {'tasks': [{'id': 'A', 'progress': 50, 'dependencies': []}], 'ok': True}
+        assert json.loads(dumps(payload)) == payload
+
+    def test_numpy_scalars(self):
+        """Test numpy scalars serialize as plain numbers."""
+        result = json.loads(dumps({'i': np.int64(3), 'f': np.float64(1.5), 'b': np.bool_(True)}))
+        assert result == {'i': 3, 'f': 1.5, 'b': True}
+
+    def test_numpy_array(self):
+        """Test numpy arrays serialize as lists."""
+        assert json.loads(dumps({'values': np.array([1, 2, 3])})) == {'values': [1, 2, 3]}
+
+    def test_timestamp(self):
+        """Test naive timestamps serialize as UTC ISO strings."""
+        result = json.loads(dumps({'when': pd.Timestamp('2024-03-15 10:30')}))
+        assert result['when'].startswith('2024-03-15T10:30:00')
+        assert result['when'].endswith('+00:00')
+
+    def test_date(self):
+        """Test dates serialize as ISO strings."""
+        assert json.loads(dumps({'day': datetime.date(2024, 3, 15)})) == {'day': '2024-03-15'}
+
+    @pytest.mark.parametrize('mapping, expected', [
+        ({1: 'a', 2.5: 'b'}, {'1': 'a', '2.5': 'b'}),
+        ({np.float64(1.5): 'a', np.int64(2): 'b'}, {'1.5': 'a', '2': 'b'}),
+    ])
+    def test_non_string_keys(self, mapping, expected):
+        """Test numeric (including numpy) dict keys serialize as strings."""
+        assert json.loads(dumps_bytes({'colorMapping': mapping})) == {'colorMapping': expected}
+
+    def test_unsupported_type(self):
+        """Test unsupported objects raise TypeError."""
+        with pytest.raises(TypeError):
+            dumps({'value': object()})
+
+    def test_bytes_match_str(self):
+        """Test dumps_bytes returns the UTF-8 encoding of dumps."""
+        payload = {'name': 'Tâche', 'progress': np.int64(50)}
+        assert dumps_bytes(payload) == dumps(payload).encode('utf-8')
+
+
+class TestLoads:
+    """Tests for loads function."""
+
+    def test_parses_str_and_bytes(self):
+        """Test str and bytes input parse to the same object."""
+        text = '{"idColumn": "id", "tooltipColumns": ["a", "b"]}'
+        assert loads(text) == loads(text.encode('utf-8')) == json.loads(text)
+
+    def test_invalid_json(self):
+        """Test invalid input raises a JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads('{not json')
+
+
+class TestResponsePayload:
+    """Tests serializing full /get-tasks payloads."""
+
+    def test_float_color_column_response(self, make_transformer):
+        """Test a transform result keyed by float colors serializes end to end."""
+        df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['A', 'B', 'C'],
+            'start': ['2024-01-01', '2024-01-02', '2024-01-03'],
+            'end': ['2024-01-05', '2024-01-06', '2024-01-07'],
+            'phase': [1.5, np.nan, 2.0]
+        })
+        result = make_transformer(color_column='phase').transform(df)
+
+        payload = json.loads(dumps_bytes(result))
+
+        assert set(payload['colorMapping']) == {'1.5', '2.0'}
+        assert [task['id'] for task in payload['tasks']] == ['1', '2', '3']
+        assert payload == json.loads(dumps(result))
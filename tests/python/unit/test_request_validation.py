@@ -0,0 +1,49 @@
+"""
+Unit tests for request_validation module.
+"""
+
+import pytest
+
+from ganttchart.request_validation import validate_request
+
+
+class TestValidateRequest:
+    """Tests for validate_request function."""
+
+    def test_valid_request(self):
+        """Test a typical request passes."""
+        config = {
+            'dataset': 'tasks',
+            'idColumn': 'id',
+            'startColumn': 'start',
+            'endColumn': 'end',
+            'tooltipColumns': ['owner'],
+            'groupByColumns': ['team'],
+            'maxTasks': '500'
+        }
+        filters = [{'filterType': 'NUMERICAL_FACET', 'column': 'cost', 'minValue': 1}]
+        validate_request(config, filters)
+
+    def test_empty_request(self):
+        """Test empty parameters pass (missing dataset is reported later)."""
+        validate_request({}, [])
+
+    def test_single_tooltip_column(self):
+        """Test a single tooltip column name is accepted."""
+        validate_request({'tooltipColumns': 'owner'}, [])
+
+    @pytest.mark.parametrize('config, filters, message', [
+        ([], [], 'config must be a JSON object'),
+        ({'idColumn': 3}, [], 'idColumn must be a column name'),
+        ({'tooltipColumns': ['a', 1]}, [], 'tooltipColumns'),
+        ({'groupByColumns': 'team'}, [], 'groupByColumns'),
+        ({'maxTasks': 'all'}, [], 'maxTasks must be an integer'),
+        ({'maxTasks': True}, [], 'maxTasks must be an integer'),
+        ({'maxTasks': None}, [], 'maxTasks must be an integer'),
+        ({}, {}, 'filters must be a JSON array'),
+        ({}, [{}, 'x'], r'filters\[1\]'),
+    ])
+    def test_rejects_malformed(self, config, filters, message):
+        """Test malformed parameters raise ValueError naming the problem."""
+        with pytest.raises(ValueError, match=message):
+            validate_request(config, filters)
@@ -0,0 +1,73 @@
+"""
+Unit tests for response_cache module.
+"""
+
+from ganttchart.response_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache class."""
+
+    def test_get_set(self):
+        """Test a stored value is returned."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set('a', b'payload')
+        assert cache.get('a') == b'payload'
+
+    def test_missing_key_returns_default(self):
+        """Test misses return the default."""
+        cache = TTLCache()
+        assert cache.get('missing') is None
+        assert cache.get('missing', 'fallback') == 'fallback'
+
+    def test_entry_expires(self):
+        """Test entries are dropped once their TTL has passed."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, timer=clock)
+        cache.set('a', 1)
+
+        clock.now = 9.9
+        assert cache.get('a') == 1
+
+        clock.now = 10.0
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_set_refreshes_ttl(self):
+        """Test setting an existing key restarts its TTL."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, timer=clock)
+        cache.set('a', 1)
+        clock.now = 8
+        cache.set('a', 2)
+        clock.now = 15
+        assert cache.get('a') == 2
+
+    def test_clear(self):
+        """Test clear removes every entry."""
+        cache = TTLCache()
+        cache.set('a', 1)
+        cache.clear()
+        assert len(cache) == 0
@@ -1,5 +1,6 @@
+import copy
 import pytest
-import datetime
+import pandas as pd
 from ganttchart.sort_utils import sort_tasks, _topological_sort, group_and_sort_tasks
 
 def create_task(id, name, start, end, deps=None):
@@ -11,50 +12,32 @@ def create_task(id, name, start, end, deps=None):
         'dependencies': deps
     }
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_tasks():
-    return [
+    # Module-scoped and immutable: sort_tasks returns a new list, never sorts in place
+    return (
         create_task('t1', 'B Task', '2024-01-05', '2024-01-10'), # Duration 5
         create_task('t2', 'A Task', '2024-01-01', '2024-01-02'), # Duration 1
         create_task('t3', 'C Task', '2024-01-03', '2024-01-15')  # Duration 12
-    ]
-
-def test_sort_none(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'none')
-    assert [t['id'] for t in sorted_tasks] == ['t1', 't2', 't3']
-
-def test_sort_start_asc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'start_asc')
-    assert [t['id'] for t in sorted_tasks] == ['t2', 't3', 't1']
-
-def test_sort_start_desc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'start_desc')
-    assert [t['id'] for t in sorted_tasks] == ['t1', 't3', 't2']
-
-def test_sort_end_asc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'end_asc')
-    assert [t['id'] for t in sorted_tasks] == ['t2', 't1', 't3']
-
-def test_sort_end_desc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'end_desc')
-    assert [t['id'] for t in sorted_tasks] == ['t3', 't1', 't2']
-
-def test_sort_name_asc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'name_asc')
-    assert [t['id'] for t in sorted_tasks] == ['t2', 't1', 't3']
-
-def test_sort_name_desc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'name_desc')
-    assert [t['id'] for t in sorted_tasks] == ['t3', 't1', 't2']
-
-def test_sort_duration_asc(sample_tasks):
-    # t2=1, t1=5, t3=12
-    sorted_tasks = sort_tasks(sample_tasks, 'duration_asc')
-    assert [t['id'] for t in sorted_tasks] == ['t2', 't1', 't3']
-
-def test_sort_duration_desc(sample_tasks):
-    sorted_tasks = sort_tasks(sample_tasks, 'duration_desc')
-    assert [t['id'] for t in sorted_tasks] == ['t3', 't1', 't2']
+    )
+
+@pytest.mark.parametrize('sort_by, expected', [
+    ('none', ['t1', 't2', 't3']),
+    ('start_asc', ['t2', 't3', 't1']),
+    ('start_desc', ['t1', 't3', 't2']),
+    ('end_asc', ['t2', 't1', 't3']),
+    ('end_desc', ['t3', 't1', 't2']),
+    ('name_asc', ['t2', 't1', 't3']),
+    ('name_desc', ['t3', 't1', 't2']),
+    ('duration_asc', ['t2', 't1', 't3']),  # t2=1, t1=5, t3=12
+    ('duration_desc', ['t3', 't1', 't2']),
+])
+def test_sort_mode(sample_tasks, sort_by, expected):
+    snapshot = copy.deepcopy(sample_tasks)
+    sorted_tasks = sort_tasks(sample_tasks, sort_by)
+    assert [t['id'] for t in sorted_tasks] == expected
+    # Shared fixture must not be mutated by sorting
+    assert sample_tasks == snapshot
 
 def test_topological_sort_simple():
     # t1 -> t2 -> t3
@@ -140,6 +123,26 @@ def tasks_with_groups():
     ]
 
 
+@pytest.fixture
+def tasks_with_groups_df(tasks_with_groups):
+    """Columnar (one column per field) view of tasks_with_groups."""
+    return pd.DataFrame({
+        'id': [t['id'] for t in tasks_with_groups],
+        'Region': [t['_group_values']['Region'] for t in tasks_with_groups],
+        'Team': [t['_group_values']['Team'] for t in tasks_with_groups],
+        'start': pd.to_datetime([t['start'] for t in tasks_with_groups]),
+        'end': pd.to_datetime([t['end'] for t in tasks_with_groups]),
+    })
+
+
+@pytest.mark.parametrize('group_by', [['Region'], ['Region', 'Team']])
+def test_group_matches_columnar_sort(tasks_with_groups, tasks_with_groups_df, group_by):
+    """Grouped start_asc order equals a stable DataFrame sort on (groups..., start)."""
+    result = group_and_sort_tasks(tasks_with_groups, group_by, 'start_asc')
+    expected = tasks_with_groups_df.sort_values(group_by + ['start'], kind='stable')['id'].tolist()
+    assert [t['id'] for t in result] == expected
+
+
 def test_group_by_single_column(tasks_with_groups):
     """Test grouping by a single column (Region)."""
     result = group_and_sort_tasks(tasks_with_groups, ['Region'], 'none')
@@ -273,3 +276,32 @@ def test_group_three_levels():
     assert ids.index('t4') < ids.index('t2')  # Canada before USA
     assert ids.index('t2') < ids.index('t1')  # USA-East before USA-West
     assert ids.index('t1') < ids.index('t3')  # USA-West-CA before USA-West-OR (alphabetical states)
+
+
+def test_group_descending_sort_with_missing_values():
+    """Test descending sort within groups keeps tasks without a value last."""
+    tasks = [
+        create_task_with_groups('t1', 'Task 1', '2024-01-01', '2024-01-05', {'Region': 'EMEA'}),
+        create_task_with_groups('t2', 'Task 2', '2024-01-09', '2024-01-10', {'Region': ''}),
+        create_task_with_groups('t3', 'Task 3', '2024-01-03', '2024-01-07', {'Region': 'EMEA'}),
+        create_task_with_groups('t4', 'Task 4', '2024-01-02', '2024-01-03', {'Region': 'APAC'}),
+        create_task_with_groups('t5', 'Task 5', '2024-01-04', '2024-01-06'),
+    ]
+
+    result = group_and_sort_tasks(tasks, ['Region'], 'start_desc')
+
+    assert [t['id'] for t in result] == ['t4', 't3', 't1', 't2', 't5']
+
+
+def test_group_dependencies_sort_within_groups():
+    """Test dependency order is applied within each group."""
+    tasks = [
+        create_task_with_groups('t1', 'Task 1', '2024-01-01', '2024-01-05', {'Region': 'EMEA'}),
+        create_task_with_groups('t2', 'Task 2', '2024-01-02', '2024-01-06', {'Region': 'APAC'}),
+        create_task_with_groups('t3', 'Task 3', '2024-01-03', '2024-01-07', {'Region': 'EMEA'}),
+    ]
+    tasks[0]['dependencies'] = ['t3']
+
+    result = group_and_sort_tasks(tasks, ['Region'], 'dependencies')
+
+    assert [t['id'] for t in result] == ['t2', 't3', 't1']
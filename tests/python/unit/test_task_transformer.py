@@ -2,11 +2,13 @@
 Unit tests for task_transformer module.
 """
 
+import dataclasses
+
 import pytest
 import pandas as pd
 import numpy as np
 
-from ganttchart.task_transformer import TaskTransformer, TaskTransformerConfig
+from ganttchart.task_transformer import TaskTransformer, _clip_progress
 
 
 class TestTaskTransformer:
@@ -33,17 +35,20 @@ class TestTaskTransformer:
         assert 'progress' in task
         assert 'dependencies' in task
 
-    def test_edge_cases(self, edge_case_df):
+    def test_config_is_immutable(self, sample_transformer_config):
+        """Test the config cannot be changed after the transformer is built."""
+        transformer = TaskTransformer(sample_transformer_config)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            transformer.config.max_tasks = 5
+
+    def test_edge_cases(self, make_transformer, edge_case_df):
         """Test handling of various edge cases."""
-        config = TaskTransformerConfig(
+        transformer = make_transformer(
             id_column='task_id',
             name_column='task_name',
-            start_column='start',
-            end_column='end',
             progress_column='progress',
             max_tasks=1000
         )
-        transformer = TaskTransformer(config)
         result = transformer.transform(edge_case_df)
 
         # Should have some skipped rows due to invalid dates
@@ -54,16 +59,24 @@ class TestTaskTransformer:
         task_ids = [t['id'] for t in result['tasks']]
         assert len(task_ids) == len(set(task_ids))  # All unique
 
-    def test_max_tasks_limit(self, large_df):
+    def test_max_tasks_limit_small(self, make_transformer):
+        """Test maxTasks limit enforcement on a small frame."""
+        df = pd.DataFrame({
+            'id': ['A', 'B', 'C', 'D'],
+            'name': ['Task A', 'Task B', 'Task C', 'Task D'],
+            'start': ['2024-01-01'] * 4,
+            'end': ['2024-01-05'] * 4
+        })
+        result = make_transformer(max_tasks=2).transform(df)
+
+        assert len(result['tasks']) == 2
+        assert result['metadata']['totalRows'] == 4
+        assert any('maxTasks' in w for w in result['metadata']['warnings'])
+
+    @pytest.mark.slow
+    def test_max_tasks_limit(self, make_transformer, large_df):
         """Test maxTasks limit enforcement."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            max_tasks=1000
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(max_tasks=1000)
         result = transformer.transform(large_df)
 
         assert len(result['tasks']) == 1000
@@ -72,49 +85,72 @@ class TestTaskTransformer:
         # Should have warning about limit
         assert any('maxTasks' in w for w in result['metadata']['warnings'])
 
-    def test_max_tasks_unlimited(self, large_df):
+    def test_max_tasks_counts_valid_rows(self, make_transformer):
+        """Test maxTasks keeps the first valid rows and reports the full valid count."""
+        df = pd.DataFrame({
+            'id': ['A', 'B', 'C', 'D', 'E'],
+            'start': ['2024-01-01', None, '2024-01-02', '2024-01-03', '2024-01-04'],
+            'end': ['2024-01-05', '2024-01-05', '2024-01-05', '2024-01-05', '2024-01-05']
+        })
+        result = make_transformer(name_column=None, max_tasks=2).transform(df)
+
+        assert [t['id'] for t in result['tasks']] == ['A', 'C']
+        assert result['metadata']['skippedRows'] == 3
+        assert result['metadata']['skipReasons'] == {'invalid_dates': 1}
+        assert any('Dataset has 4 tasks' in w for w in result['metadata']['warnings'])
+
+    @pytest.mark.parametrize('sort_by', ['none', 'start'])
+    def test_max_tasks_keeps_dependencies_past_limit(self, make_transformer, sort_by):
+        """Test a dependency on a valid task past maxTasks is kept, not reported missing."""
+        df = pd.DataFrame({
+            'id': ['A', 'B', 'C', 'C'],
+            'name': ['Task A', 'Task B', 'Task C', 'Task C2'],
+            'start': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04'],
+            'end': ['2024-01-05', '2024-01-05', '2024-01-05', '2024-01-05'],
+            'deps': ['C_1', 'C, Z', None, None]
+        })
+        result = make_transformer(
+            dependencies_column='deps', sort_by=sort_by, max_tasks=2
+        ).transform(df)
+
+        tasks = result['tasks']
+        assert [t['dependencies'] for t in tasks] == [['C_1'], ['C']]
+        assert [t['_display_dependencies'] for t in tasks] == ['Task C2', 'Task C']
+        warnings = [w for w in result['metadata']['warnings'] if 'non-existent' in w]
+        assert warnings == ["Task 'B' references non-existent tasks: Z. Removed."]
+
+    @pytest.mark.slow
+    def test_max_tasks_unlimited(self, make_transformer, large_df):
         """Test maxTasks=0 (unlimited)."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            max_tasks=0
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(max_tasks=0)
         result = transformer.transform(large_df)
 
         # Should process all tasks
         assert len(result['tasks']) == 2000
 
-    def test_empty_dataframe(self):
+    def test_empty_dataframe(self, make_transformer):
         """Test handling of empty DataFrame."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         df = pd.DataFrame()
 
         with pytest.raises(ValueError, match="empty"):
             transformer.transform(df)
 
-    def test_missing_required_column(self, sample_gantt_df):
+    def test_none_dataframe(self, make_transformer):
+        """Test handling of a missing DataFrame."""
+        transformer = make_transformer(name_column=None)
+
+        with pytest.raises(ValueError, match="empty"):
+            transformer.transform(None)
+
+    def test_missing_required_column(self, make_transformer, sample_gantt_df):
         """Test error when required column is missing."""
-        config = TaskTransformerConfig(
-            id_column='nonexistent',
-            name_column='task_name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(id_column='nonexistent', name_column='task_name')
 
         with pytest.raises(ValueError, match="not found"):
             transformer.transform(sample_gantt_df)
 
-    def test_null_task_id_generation(self):
+    def test_null_task_id_generation(self, make_transformer):
         """Test generation of task IDs for null values."""
         df = pd.DataFrame({
             'id': [None, None, 'A'],
@@ -122,13 +158,7 @@ class TestTaskTransformer:
             'start': ['2024-01-01', '2024-01-02', '2024-01-03'],
             'end': ['2024-01-05', '2024-01-06', '2024-01-07']
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         # First two tasks should have generated IDs
@@ -136,7 +166,7 @@ class TestTaskTransformer:
         assert result['tasks'][1]['id'].startswith('task_')
         assert result['tasks'][2]['id'] == 'A'
 
-    def test_null_task_name_generation(self):
+    def test_null_task_name_generation(self, make_transformer):
         """Test generation of task names for null values."""
         df = pd.DataFrame({
             'id': ['A', 'B', 'C'],
@@ -144,13 +174,7 @@ class TestTaskTransformer:
             'start': ['2024-01-01', '2024-01-02', '2024-01-03'],
             'end': ['2024-01-05', '2024-01-06', '2024-01-07']
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         # First two tasks should have ID as name (fallback)
@@ -159,7 +183,7 @@ class TestTaskTransformer:
         # Third task has explicit name
         assert result['tasks'][2]['name'] == 'Task C'
 
-    def test_duplicate_id_handling(self):
+    def test_duplicate_id_handling(self, make_transformer):
         """Test handling of duplicate task IDs."""
         df = pd.DataFrame({
             'id': ['A', 'A', 'A'],
@@ -167,13 +191,7 @@ class TestTaskTransformer:
             'start': ['2024-01-01', '2024-01-02', '2024-01-03'],
             'end': ['2024-01-05', '2024-01-06', '2024-01-07']
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         task_ids = [t['id'] for t in result['tasks']]
@@ -183,7 +201,7 @@ class TestTaskTransformer:
         assert task_ids[1] == 'A_1'
         assert task_ids[2] == 'A_2'
 
-    def test_progress_clamping(self):
+    def test_progress_clamping(self, make_transformer):
         """Test progress value clamping to [0, 100]."""
         df = pd.DataFrame({
             'id': ['A', 'B', 'C'],
@@ -192,21 +210,14 @@ class TestTaskTransformer:
             'end': ['2024-01-05', '2024-01-06', '2024-01-07'],
             'progress': [-10, 150, 50]
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            progress_column='progress'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(progress_column='progress')
         result = transformer.transform(df)
 
         assert result['tasks'][0]['progress'] == 0  # Clamped from -10
         assert result['tasks'][1]['progress'] == 100  # Clamped from 150
         assert result['tasks'][2]['progress'] == 50  # Unchanged
 
-    def test_invalid_progress_handling(self):
+    def test_invalid_progress_handling(self, make_transformer):
         """Test handling of invalid progress values."""
         df = pd.DataFrame({
             'id': ['A', 'B'],
@@ -215,21 +226,14 @@ class TestTaskTransformer:
             'end': ['2024-01-05', '2024-01-06'],
             'progress': ['invalid', None]
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            progress_column='progress'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(progress_column='progress')
         result = transformer.transform(df)
 
         # Invalid progress should result in no progress field
         assert 'progress' not in result['tasks'][0] or result['tasks'][0]['progress'] is None
         assert 'progress' not in result['tasks'][1] or result['tasks'][1]['progress'] is None
 
-    def test_start_after_end_skipped(self):
+    def test_start_after_end_skipped(self, make_transformer):
         """Test that tasks with start > end are skipped."""
         df = pd.DataFrame({
             'id': ['A', 'B'],
@@ -237,13 +241,7 @@ class TestTaskTransformer:
             'start': ['2024-01-10', '2024-01-01'],
             'end': ['2024-01-01', '2024-01-05']  # A has start > end
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         # Only task B should be processed
@@ -252,17 +250,27 @@ class TestTaskTransformer:
         assert result['metadata']['skippedRows'] == 1
         assert 'start_after_end' in result['metadata']['skipReasons']
 
-    def test_color_mapping(self, sample_gantt_df):
+    def test_dates_outside_nanosecond_range_kept(self, make_transformer):
+        """Test far-future and far-past dates are compared, not dropped."""
+        df = pd.DataFrame({
+            'id': ['A', 'B', 'C'],
+            'name': ['Task A', 'Task B', 'Task C'],
+            'start': ['2024-01-01', '2024-02-01', '1600-01-01'],
+            'end': ['9999-12-31', '2300-06-01', '1600-01-05']
+        })
+        result = make_transformer().transform(df)
+
+        assert [t['end'] for t in result['tasks']] == ['9999-12-31', '2300-06-01', '1600-01-05']
+        assert result['metadata']['skippedRows'] == 0
+
+    def test_color_mapping(self, make_transformer, sample_gantt_df):
         """Test color mapping integration."""
-        config = TaskTransformerConfig(
+        transformer = make_transformer(
             id_column='task_id',
             name_column='task_name',
-            start_column='start',
-            end_column='end',
             color_column='category',
             max_tasks=1000
         )
-        transformer = TaskTransformer(config)
         result = transformer.transform(sample_gantt_df)
 
         # Should have colorMapping in result
@@ -275,7 +283,7 @@ class TestTaskTransformer:
             assert 'custom_class' in task
             assert task['custom_class'].startswith('bar-')
 
-    def test_dependencies_parsing(self):
+    def test_dependencies_parsing(self, make_transformer):
         """Test parsing of dependencies column."""
         df = pd.DataFrame({
             'id': ['A', 'B', 'C'],
@@ -284,18 +292,11 @@ class TestTaskTransformer:
             'end': ['2024-01-05', '2024-01-10', '2024-01-15'],
             'deps': ['', 'A', 'A, B']  # Note: space after comma
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            dependencies_column='deps'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(dependencies_column='deps')
         result = transformer.transform(df)
 
         assert result['tasks'][0]['dependencies'] == []
-    def test_custom_tooltips_basic(self):
+    def test_custom_tooltips_basic(self, make_transformer):
         """Test basic custom tooltip extraction."""
         df = pd.DataFrame({
             'id': ['A'],
@@ -305,14 +306,7 @@ class TestTaskTransformer:
             'assignee': ['John Doe'],
             'priority': ['High']
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            tooltip_columns=['assignee', 'priority']
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(tooltip_columns=['assignee', 'priority'])
         result = transformer.transform(df)
 
         task = result['tasks'][0]
@@ -323,7 +317,7 @@ class TestTaskTransformer:
         assert task['custom_fields'][0] == {'label': 'assignee', 'value': 'John Doe'}
         assert task['custom_fields'][1] == {'label': 'priority', 'value': 'High'}
 
-    def test_custom_tooltips_ordering(self):
+    def test_custom_tooltips_ordering(self, make_transformer):
         """Test that custom tooltips preserve configuration order."""
         df = pd.DataFrame({
             'id': ['A'],
@@ -335,14 +329,7 @@ class TestTaskTransformer:
             'col3': ['3']
         })
         # Order: col3, col1 (skip col2)
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            tooltip_columns=['col3', 'col1']
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(tooltip_columns=['col3', 'col1'])
         result = transformer.transform(df)
 
         fields = result['tasks'][0]['custom_fields']
@@ -352,7 +339,7 @@ class TestTaskTransformer:
         assert fields[1]['label'] == 'col1'
         assert fields[1]['value'] == '1'
 
-    def test_custom_tooltips_formatting(self):
+    def test_custom_tooltips_formatting(self, make_transformer):
         """Test formatting of various data types in tooltips."""
         df = pd.DataFrame({
             'id': ['A'],
@@ -365,14 +352,9 @@ class TestTaskTransformer:
             'nan_val': [np.nan],
             'date_val': [pd.Timestamp('2024-03-15')]
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
+        transformer = make_transformer(
             tooltip_columns=['number', 'float', 'null_val', 'nan_val', 'date_val']
         )
-        transformer = TaskTransformer(config)
         result = transformer.transform(df)
 
         fields = result['tasks'][0]['custom_fields']
@@ -397,7 +379,7 @@ class TestTaskTransformer:
         assert fields[4]['label'] == 'date_val'
         assert fields[4]['value'] == '2024-03-15'
 
-    def test_custom_tooltips_missing_col(self):
+    def test_custom_tooltips_missing_col(self, make_transformer):
         """Test graceful handling of missing tooltip columns."""
         df = pd.DataFrame({
             'id': ['A'],
@@ -406,14 +388,7 @@ class TestTaskTransformer:
             'end': ['2024-01-05'],
             'col1': ['Value']
         })
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            tooltip_columns=['col1', 'missing_col']
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(tooltip_columns=['col1', 'missing_col'])
         result = transformer.transform(df)
 
         fields = result['tasks'][0]['custom_fields']
@@ -421,84 +396,101 @@ class TestTaskTransformer:
         assert fields[0]['label'] == 'col1'
         assert fields[0]['value'] == 'Value'
 
+    def test_custom_tooltips_repeated_strings(self, make_transformer):
+        """Test low-cardinality string tooltips are stripped and shared per value."""
+        df = pd.DataFrame({
+            'id': ['A', 'B', 'C', 'D', 'E'],
+            'start': ['2024-01-01'] * 5,
+            'end': ['2024-01-05'] * 5,
+            'owner': [' Alice ', 'Bob', ' Alice ', None, 'Bob']
+        })
+        result = make_transformer(name_column=None, tooltip_columns=['owner']).transform(df)
+
+        values = [t['custom_fields'][0]['value'] for t in result['tasks']]
+        assert values == ['Alice', 'Bob', 'Alice', None, 'Bob']
+        assert values[0] is values[2]
+
+
+class TestClipProgress:
+    """Tests for _clip_progress helper."""
+
+    @pytest.mark.parametrize('raw, expected', [
+        (-10.0, 0),
+        (150.0, 100),
+        (50.0, 50),
+        (99.9, 99),
+        (-0.5, 0),
+        (np.inf, 100),
+    ])
+    def test_truncates_and_clamps(self, raw, expected):
+        """Test truncation toward zero and clamping to [0, 100]."""
+        progress, valid = _clip_progress(np.array([raw]))
+        assert progress.tolist() == [expected]
+        assert valid.all()
+
+    def test_nan_marked_invalid(self):
+        """Test NaN entries are flagged invalid."""
+        progress, valid = _clip_progress(np.array([np.nan, 25.0]))
+        assert valid.tolist() == [False, True]
+        assert progress[1] == 25
+
+    def test_empty(self):
+        """Test empty input."""
+        progress, valid = _clip_progress(np.array([], dtype=np.float64))
+        assert len(progress) == 0
+        assert len(valid) == 0
+
 
 class TestIDNormalization:
     """Tests for ID normalization and type handling."""
 
-    def test_normalize_id_integer(self):
-        """Test normalization of integer IDs."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-        
-        # Integer should convert to string
-        assert transformer._normalize_id(277) == '277'
-        assert transformer._normalize_id(0) == '0'
-        assert transformer._normalize_id(-5) == '-5'
-
-    def test_normalize_id_float_whole_number(self):
-        """Test normalization of whole-number floats (Pandas NaN column issue)."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-        
-        # Whole number floats should convert to int representation
-        assert transformer._normalize_id(277.0) == '277'
-        assert transformer._normalize_id(0.0) == '0'
-        assert transformer._normalize_id(-5.0) == '-5'
-
-    def test_normalize_id_float_decimal(self):
-        """Test normalization of actual decimal floats - made CSS-safe."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-
+    @pytest.mark.parametrize('raw, expected', [
+        # Integers convert to string
+        (277, '277'),
+        (0, '0'),
+        (-5, '-5'),
+        # Whole-number floats (Pandas NaN column issue) use the int form
+        (277.0, '277'),
+        (0.0, '0'),
+        (-5.0, '-5'),
         # Actual decimals are hex-encoded to be CSS-safe (period → _x2e_)
-        assert transformer._normalize_id(3.14) == '3_x2e_14'
-        assert transformer._normalize_id(0.5) == '0_x2e_5'
-        assert transformer._normalize_id(-1.75) == '-1_x2e_75'
-
-    def test_normalize_id_string(self):
-        """Test normalization of string IDs."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-        
-        assert transformer._normalize_id('abc') == 'abc'
-        assert transformer._normalize_id('  whitespace  ') == 'whitespace'
-        assert transformer._normalize_id('123') == '123'
-
-    def test_normalize_id_nan(self):
-        """Test normalization of NaN values."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-        
-        assert transformer._normalize_id(np.nan) == ''
-        assert transformer._normalize_id(pd.NA) == ''
-        assert transformer._normalize_id(None) == ''
-
-    def test_pandas_type_mismatch_scenario(self):
+        (3.14, '3_x2e_14'),
+        (0.5, '0_x2e_5'),
+        (-1.75, '-1_x2e_75'),
+        # Strings are stripped
+        ('abc', 'abc'),
+        ('  whitespace  ', 'whitespace'),
+        ('123', '123'),
+        # Missing values become empty
+        (np.nan, ''),
+        (pd.NA, ''),
+        (None, ''),
+    ])
+    def test_normalize_id(self, shared_transformer, raw, expected):
+        """Test normalization of int, float, string and missing IDs."""
+        assert shared_transformer._normalize_id(raw) == expected
+
+    def test_normalize_id_cache_keeps_types_apart(self, shared_transformer):
+        """Test equal-hashing values of different types are not conflated by the cache."""
+        assert shared_transformer._normalize_id(1) == '1'
+        assert shared_transformer._normalize_id(1.0) == '1'
+        assert shared_transformer._normalize_id(True) == 'True'
+        assert shared_transformer._normalize_id(1.5) == '1_x2e_5'
+
+    @pytest.mark.parametrize('values', [
+        pd.Series([277, 0, -5]),
+        pd.Series([277.0, -5.0, 3.14, 1e-05, 1e20, np.inf, np.nan]),
+        pd.Series([1, None, 3], dtype='Int64'),
+        pd.Series(['abc', '  whitespace  ', '1.0', '54.8', 'a b', None]),
+        pd.Series([1, 2.0, 'B', True, 3.5, None, ' 7 ']),
+        pd.Series([], dtype=object),
+    ])
+    def test_normalize_id_series_matches_scalar(self, shared_transformer, values):
+        """Test the column-wise normalization agrees with _normalize_id()."""
+        expected = [shared_transformer._normalize_id(v) for v in values.tolist()]
+        assert list(shared_transformer._normalize_id_series(values)) == expected
+
+    def test_pandas_type_mismatch_scenario(self, make_transformer):
         """Test the real-world Pandas type mismatch scenario."""
         # Simulate Pandas behavior: ID column (no NaNs) = int, Dependency column (has NaNs) = float
         df = pd.DataFrame({
@@ -509,14 +501,7 @@ class TestIDNormalization:
             'deps': [np.nan, 276.0, 277.0]  # Will be float64 due to NaN
         })
         
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            dependencies_column='deps'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(dependencies_column='deps')
         result = transformer.transform(df)
         
         # Task 276: int ID, no dependencies
@@ -531,7 +516,7 @@ class TestIDNormalization:
         assert result['tasks'][2]['id'] == '278'
         assert result['tasks'][2]['dependencies'] == ['277']  # Should match!
 
-    def test_multiple_dependencies_numeric(self):
+    def test_multiple_dependencies_numeric(self, make_transformer):
         """Test multiple numeric dependencies in comma-separated string."""
         df = pd.DataFrame({
             'id': [1, 2, 3, 4],
@@ -541,14 +526,7 @@ class TestIDNormalization:
             'deps': ['', '1', '1, 2', '2, 3']  # Multiple deps as comma-separated string
         })
         
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            dependencies_column='deps'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(dependencies_column='deps')
         result = transformer.transform(df)
         
         assert result['tasks'][0]['dependencies'] == []
@@ -556,7 +534,7 @@ class TestIDNormalization:
         assert result['tasks'][2]['dependencies'] == ['1', '2']
         assert result['tasks'][3]['dependencies'] == ['2', '3']
 
-    def test_multiple_dependencies_with_floats(self):
+    def test_multiple_dependencies_with_floats(self, make_transformer):
         """Test multiple float dependencies (Pandas NaN scenario)."""
         df = pd.DataFrame({
             'id': [1, 2, 3, 4],
@@ -566,14 +544,7 @@ class TestIDNormalization:
             'deps': [np.nan, '1.0', '1.0, 2.0', '2.0, 3.0']  # Floats in strings
         })
         
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            dependencies_column='deps'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(dependencies_column='deps')
         result = transformer.transform(df)
         
         # Float deps in strings should be normalized to ints
@@ -582,7 +553,7 @@ class TestIDNormalization:
         assert result['tasks'][2]['dependencies'] == ['1', '2']
         assert result['tasks'][3]['dependencies'] == ['2', '3']
 
-    def test_dependency_whitespace_handling(self):
+    def test_dependency_whitespace_handling(self, make_transformer):
         """Test that whitespace in dependency strings is handled correctly."""
         df = pd.DataFrame({
             'id': ['A', 'B', 'C'],
@@ -592,21 +563,14 @@ class TestIDNormalization:
             'deps': ['', '  A  ', ' A , B ']  # Extra whitespace
         })
         
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            dependencies_column='deps'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(dependencies_column='deps')
         result = transformer.transform(df)
         
         assert result['tasks'][0]['dependencies'] == []
         assert result['tasks'][1]['dependencies'] == ['A']
         assert result['tasks'][2]['dependencies'] == ['A', 'B']
 
-    def test_string_ids_with_dependencies(self):
+    def test_string_ids_with_dependencies(self, make_transformer):
         """Test string IDs with string dependencies."""
         df = pd.DataFrame({
             'id': ['task_a', 'task_b', 'task_c'],
@@ -616,14 +580,7 @@ class TestIDNormalization:
             'deps': ['', 'task_a', 'task_a, task_b']
         })
         
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end',
-            dependencies_column='deps'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer(dependencies_column='deps')
         result = transformer.transform(df)
         
         assert result['tasks'][0]['id'] == 'task_a'
@@ -637,74 +594,43 @@ class TestIDNormalization:
 class TestCssSafe:
     """Test CSS-safe ID encoding."""
 
-    def test_make_css_safe_period(self):
-        """Test that periods are hex-encoded."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-
-        assert transformer._make_css_safe('54.8') == '54_x2e_8'
-        assert transformer._make_css_safe('3.14.15') == '3_x2e_14_x2e_15'
-
-    def test_make_css_safe_space(self):
-        """Test that spaces are hex-encoded."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-
-        assert transformer._make_css_safe('task 1') == 'task_x20_1'
-        assert transformer._make_css_safe('my task') == 'my_x20_task'
-
-    def test_make_css_safe_special_chars(self):
-        """Test that various special characters are hex-encoded."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-
-        assert transformer._make_css_safe('item#5') == 'item_x23_5'
-        assert transformer._make_css_safe('task[1]') == 'task_x5b_1_x5d_'
-        assert transformer._make_css_safe('a:b') == 'a_x3a_b'
-
-    def test_make_css_safe_preserves_safe_chars(self):
-        """Test that alphanumerics, underscores, and hyphens are preserved."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-
-        assert transformer._make_css_safe('task-1') == 'task-1'
-        assert transformer._make_css_safe('task_1') == 'task_1'
-        assert transformer._make_css_safe('Task123') == 'Task123'
-        assert transformer._make_css_safe('ABC-xyz_123') == 'ABC-xyz_123'
-
-    def test_make_css_safe_no_collision(self):
+    @pytest.mark.parametrize('raw, expected', [
+        # Periods are hex-encoded
+        ('54.8', '54_x2e_8'),
+        ('3.14.15', '3_x2e_14_x2e_15'),
+        # Spaces are hex-encoded
+        ('task 1', 'task_x20_1'),
+        ('my task', 'my_x20_task'),
+        # Other special characters are hex-encoded
+        ('item#5', 'item_x23_5'),
+        ('task[1]', 'task_x5b_1_x5d_'),
+        ('a:b', 'a_x3a_b'),
+        # Alphanumerics, underscores, and hyphens are preserved
+        ('task-1', 'task-1'),
+        ('task_1', 'task_1'),
+        ('Task123', 'Task123'),
+        ('ABC-xyz_123', 'ABC-xyz_123'),
+    ])
+    def test_make_css_safe(self, shared_transformer, raw, expected):
+        """Test hex-encoding of characters that are not CSS-safe."""
+        assert shared_transformer._make_css_safe(raw) == expected
+
+    @pytest.mark.parametrize('raw, expected', [
+        ('a~b', 'a_x7e_b'),
+        ('path/to', 'path_x2f_to'),
+        ('café', 'caf_xe9_'),
+        ('€5', '_x20ac_5'),
+        ('', ''),
+    ])
+    def test_make_css_safe_corner_chars(self, shared_transformer, raw, expected):
+        """Test encoding uses the code point, including for non-ASCII characters."""
+        assert shared_transformer._make_css_safe(raw) == expected
+
+    def test_make_css_safe_no_collision(self, shared_transformer):
         """Test that similar IDs don't collide after encoding."""
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
-
         # These should produce different outputs
-        id1 = transformer._make_css_safe('54.8')
-        id2 = transformer._make_css_safe('54_8')
+        id1 = shared_transformer._make_css_safe('54.8')
+        id2 = shared_transformer._make_css_safe('54_8')
 
         assert id1 != id2
         assert id1 == '54_x2e_8'
@@ -712,112 +638,65 @@ class TestCssSafe:
 
 
 class TestExpectedProgress:
-    """Tests for expected progress calculation."""
+    """Tests for expected progress calculation (today pinned to 2024-06-15)."""
 
-    def test_expected_progress_in_progress_task(self):
+    def test_expected_progress_in_progress_task(self, make_transformer, frozen_today):
         """Test expected progress for a task that spans today."""
-        from datetime import date, timedelta
-
-        today = date.today()
-        start = today - timedelta(days=5)
-        end = today + timedelta(days=5)
-
         df = pd.DataFrame({
             'id': ['1'],
             'name': ['Test Task'],
-            'start': [start.strftime('%Y-%m-%d')],
-            'end': [end.strftime('%Y-%m-%d')]
+            'start': ['2024-06-10'],
+            'end': ['2024-06-20']
         })
 
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         task = result['tasks'][0]
         assert '_expected_progress' in task
         # 5 days elapsed out of 10 total = 50%
-        assert 49 <= task['_expected_progress'] <= 51  # Allow small variance
+        assert task['_expected_progress'] == 50.0
 
-    def test_expected_progress_future_task(self):
+    def test_expected_progress_future_task(self, make_transformer, frozen_today):
         """Test that future tasks have no expected progress marker."""
-        from datetime import date, timedelta
-
-        today = date.today()
-        start = today + timedelta(days=5)
-        end = today + timedelta(days=15)
-
         df = pd.DataFrame({
             'id': ['1'],
             'name': ['Future Task'],
-            'start': [start.strftime('%Y-%m-%d')],
-            'end': [end.strftime('%Y-%m-%d')]
+            'start': ['2024-06-20'],
+            'end': ['2024-06-30']
         })
 
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         task = result['tasks'][0]
         assert '_expected_progress' not in task
 
-    def test_expected_progress_past_task(self):
+    def test_expected_progress_past_task(self, make_transformer, frozen_today):
         """Test that past tasks have no expected progress marker."""
-        from datetime import date, timedelta
-
-        today = date.today()
-        start = today - timedelta(days=20)
-        end = today - timedelta(days=10)
-
         df = pd.DataFrame({
             'id': ['1'],
             'name': ['Past Task'],
-            'start': [start.strftime('%Y-%m-%d')],
-            'end': [end.strftime('%Y-%m-%d')]
+            'start': ['2024-05-26'],
+            'end': ['2024-06-05']
         })
 
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         task = result['tasks'][0]
         assert '_expected_progress' not in task
 
-    def test_expected_progress_starts_today(self):
+    def test_expected_progress_starts_today(self, make_transformer, frozen_today):
         """Test expected progress when task starts today."""
-        from datetime import date, timedelta
-
-        today = date.today()
-        end = today + timedelta(days=10)
-
         df = pd.DataFrame({
             'id': ['1'],
             'name': ['Starts Today'],
-            'start': [today.strftime('%Y-%m-%d')],
-            'end': [end.strftime('%Y-%m-%d')]
+            'start': ['2024-06-15'],
+            'end': ['2024-06-25']
         })
 
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         task = result['tasks'][0]
@@ -825,27 +704,16 @@ class TestExpectedProgress:
         # 0 days elapsed out of 10 = 0%
         assert task['_expected_progress'] == 0.0
 
-    def test_expected_progress_ends_today(self):
+    def test_expected_progress_ends_today(self, make_transformer, frozen_today):
         """Test expected progress when task ends today."""
-        from datetime import date, timedelta
-
-        today = date.today()
-        start = today - timedelta(days=10)
-
         df = pd.DataFrame({
             'id': ['1'],
             'name': ['Ends Today'],
-            'start': [start.strftime('%Y-%m-%d')],
-            'end': [today.strftime('%Y-%m-%d')]
+            'start': ['2024-06-05'],
+            'end': ['2024-06-15']
         })
 
-        config = TaskTransformerConfig(
-            id_column='id',
-            name_column='name',
-            start_column='start',
-            end_column='end'
-        )
-        transformer = TaskTransformer(config)
+        transformer = make_transformer()
         result = transformer.transform(df)
 
         task = result['tasks'][0]
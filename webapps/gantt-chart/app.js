@@ -964,7 +964,31 @@
             config: JSON.stringify(config),
             filters: JSON.stringify(filters)
         };
-        return dataiku.webappBackend.get('get-tasks', params);
+        return dataiku.webappBackend.get('get-tasks', params).then(expandColumnarTasks);
+    }
+
+    /**
+     * Expand a columnar task payload ({columns, rows}) back into task objects.
+     * The backend sends large task lists this way so each key is sent once;
+     * a null cell is a key the task did not have.
+     */
+    function expandColumnarTasks(response) {
+        if (!response || !response.tasksColumnar) {
+            return response;
+        }
+
+        const columns = response.tasksColumnar.columns;
+        response.tasks = response.tasksColumnar.rows.map(row => {
+            const task = {};
+            for (let i = 0; i < columns.length; i++) {
+                if (row[i] !== null) {
+                    task[columns[i]] = row[i];
+                }
+            }
+            return task;
+        });
+        delete response.tasksColumnar;
+        return response;
     }
 
     // ===== CONFIG BUILDING =====
@@ -9,18 +9,57 @@ Provides two main endpoints:
 import dataiku
 from dataiku.customwebapp import *
 from flask import request
+import pandas as pd
+import gzip
+import hashlib
 import json
+import os
 import traceback
+import uuid
 import logging
-from functools import reduce
+from functools import lru_cache
+from operator import itemgetter
 
 # Import our transformation logic
 from ganttchart.task_transformer import TaskTransformer, TaskTransformerConfig
 from ganttchart.sort_utils import sort_tasks, group_and_sort_tasks
+from ganttchart.json_encoder import dumps, dumps_bytes, loads
+from ganttchart.filters import apply_dataiku_filters, filter_chunks
+from ganttchart.response_cache import TTLCache
+from ganttchart.request_validation import validate_request
 
 logger = logging.getLogger(__name__)
 
 
+def _read_chunk_rows(default=50000):
+    """Rows per chunk for chunked dataset reads (GANTT_READ_CHUNK_ROWS env var)."""
+    try:
+        rows = int(os.environ.get('GANTT_READ_CHUNK_ROWS', default))
+    except ValueError:
+        logger.warning(f"Invalid GANTT_READ_CHUNK_ROWS, using {default}")
+        return default
+    return rows if rows > 0 else default
+
+
+# Rows per chunk when filters are applied while reading the dataset
+FILTER_CHUNK_ROWS = _read_chunk_rows()
+
+# Above this many tasks, /get-tasks sends them in columnar form
+COLUMNAR_TASK_THRESHOLD = 500
+
+# Responses smaller than this are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+# Serialized /get-tasks responses, keyed by dataset, resolved palette and
+# request parameters. Freshness is TTL-only: a rebuild or edit of the
+# dataset shows up once the entry expires (at most 60s later).
+_tasks_cache = TTLCache(maxsize=32, ttl=60)
+
+# Resolved preset values, keyed by (parameter set, preset name); saves the
+# plugin settings API calls on every request that uses a preset
+_preset_cache = TTLCache(maxsize=16, ttl=60)
+
+
 def resolve_preset(preset_ref, parameter_set_id):
     """
     Resolve a PRESET parameter reference to its actual values.
@@ -55,6 +94,11 @@ def resolve_preset(preset_ref, parameter_set_id):
             logger.warning("PRESET mode but no name provided")
             return None
 
+        cache_key = (parameter_set_id, preset_name)
+        cached = _preset_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Get the plugin settings to resolve the preset
             client = dataiku.api_client()
@@ -68,6 +112,7 @@ def resolve_preset(preset_ref, parameter_set_id):
             preset = parameter_set.get_preset(preset_name)
             if preset:
                 # Note: config is a property, not a method
+                _preset_cache.set(cache_key, preset.config)
                 return preset.config
 
             logger.warning(f"Preset '{preset_name}' not found in '{parameter_set_id}'")
@@ -82,6 +127,188 @@ def resolve_preset(preset_ref, parameter_set_id):
         return preset_ref
 
 
+def resolve_color_palette(config):
+    """
+    Resolve the palette selection, including a custom palette preset.
+
+    Args:
+        config: Webapp config dict from the request
+
+    Returns:
+        Tuple of (palette name, custom hex colors or None); falls back to
+        ('classic', None) if the custom palette is missing or invalid
+    """
+    color_palette = config.get('colorPalette', 'classic')
+    custom_colors = None
+
+    if color_palette == 'custom':
+        # Resolve the preset reference to actual values
+        preset_ref = config.get('customPalettePreset', {})
+        preset_config = resolve_preset(preset_ref, 'custom-palette')
+
+        if preset_config:
+            colors_json = preset_config.get('colors', '[]')
+            try:
+                parsed_colors = json.loads(colors_json)
+                if isinstance(parsed_colors, list) and len(parsed_colors) >= 6:
+                    custom_colors = parsed_colors[:12]  # Cap at 12 colors
+                else:
+                    logger.warning("Custom palette must have at least 6 colors. Using classic.")
+                    color_palette = 'classic'
+            except json.JSONDecodeError as e:
+                logger.warning(f"Invalid JSON in custom palette colors: {e}. Using classic.")
+                color_palette = 'classic'
+        else:
+            logger.warning("Custom palette selected but no preset configured. Using classic.")
+            color_palette = 'classic'
+
+    return color_palette, custom_colors
+
+
+def column_list(value):
+    """
+    Return a config value holding one or more column names as a list.
+
+    A single column name is wrapped, as TaskTransformer does for
+    tooltipColumns, instead of being split into characters.
+
+    Args:
+        value: Column name, list of column names, or None
+
+    Returns:
+        List of column names
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def get_required_columns(config, filters):
+    """
+    List the dataset columns a /get-tasks request reads.
+
+    Args:
+        config: Webapp config dict from the request
+        filters: Filter dicts from Dataiku's filtering UI
+
+    Returns:
+        Column names (config columns, then tooltip, group-by and filter
+        columns), without duplicates or empty entries
+    """
+    columns = [
+        config.get('idColumn'),
+        config.get('nameColumn'),
+        config.get('startColumn'),
+        config.get('endColumn'),
+        config.get('progressColumn'),
+        config.get('dependenciesColumn'),
+        config.get('colorColumn'),
+        *column_list(config.get('tooltipColumns')),
+        *column_list(config.get('groupByColumns')),
+        *(f.get('column') for f in filters or [])
+    ]
+    return list(dict.fromkeys(col for col in columns if col))
+
+
+def read_dataset_columns(dataset, columns):
+    """
+    Read only the given columns of a dataset.
+
+    Falls back to reading every column if the projected read fails (e.g. a
+    configured column no longer exists), so the transformer can report the
+    missing column along with the available ones.
+
+    Args:
+        dataset: dataiku.Dataset to read
+        columns: Column names to read
+
+    Returns:
+        pandas DataFrame
+    """
+    if columns:
+        try:
+            return dataset.get_dataframe(columns=columns)
+        except Exception as e:
+            logger.warning(f"Projected dataset read failed ({e}), reading all columns")
+    return dataset.get_dataframe()
+
+
+def read_filtered_chunks(dataset, columns, filters):
+    """
+    Read a dataset chunk by chunk, keeping only the rows that pass the filters.
+
+    Rows that are filtered out are dropped FILTER_CHUNK_ROWS at a time
+    instead of all being held in memory. Only the filtering is chunked: the
+    transform needs every surviving row at once (duplicate IDs, dependency
+    references, the color mapping and sorting all span the whole dataset).
+
+    Args:
+        dataset: dataiku.Dataset to read
+        columns: Column names to read (None or empty for all)
+        filters: Filter dicts from Dataiku's filtering UI
+
+    Returns:
+        pandas DataFrame of the surviving rows
+
+    Raises:
+        ValueError: If the filters remove every row
+    """
+    return filter_chunks(
+        dataset.iter_dataframes(chunksize=FILTER_CHUNK_ROWS, columns=columns or None),
+        filters
+    )
+
+
+def read_dataset(dataset, columns, filters):
+    """
+    Read the needed columns of a dataset, filtering while reading if possible.
+
+    If the chunked read fails, or the filters remove every row, the full
+    columns are read instead and get_tasks applies the filters (and its
+    every-row-removed fallback) itself.
+
+    Args:
+        dataset: dataiku.Dataset to read
+        columns: Column names to read
+        filters: Filter dicts from Dataiku's filtering UI
+
+    Returns:
+        Tuple of (DataFrame, whether filters were already applied)
+    """
+    if filters:
+        try:
+            return read_filtered_chunks(dataset, columns, filters), True
+        except Exception as e:
+            logger.warning(f"Chunked filtered read gave no rows ({e}), filtering after a full read")
+    return read_dataset_columns(dataset, columns), False
+
+
+def shrink_integer_columns(df, skip_columns=()):
+    """
+    Downcast int64 columns to the smallest integer type holding their values.
+
+    Lossless, so the transformer output is unchanged. Float columns are left
+    alone (float32 would change IDs such as 3.14), as are object columns
+    (the transformer already factorizes repeated strings) and skip_columns.
+
+    Args:
+        df: DataFrame to shrink
+        skip_columns: Columns to keep as they are (e.g. Unix-timestamp dates)
+
+    Returns:
+        DataFrame with downcast integer columns
+    """
+    downcast = {}
+    for column in df.select_dtypes(include='int64').columns:
+        if column not in skip_columns:
+            dtype = pd.to_numeric(df[column], downcast='integer').dtype
+            if dtype != df[column].dtype:
+                downcast[column] = dtype
+    return df.astype(downcast) if downcast else df
+
+
 @app.route('/get-tasks')
 def get_tasks():
     """
@@ -91,14 +318,26 @@ def get_tasks():
         # Parse request parameters
         config_str = request.args.get('config', '{}')
         filters_str = request.args.get('filters', '[]')
-        config = json.loads(config_str)
-        filters = json.loads(filters_str)
+
+        # Reject malformed parameters before touching the dataset
+        try:
+            config = loads(config_str)
+            filters = loads(filters_str)
+            validate_request(config, filters)
+        except ValueError as e:
+            return dumps({
+                'error': {
+                    'code': 'INVALID_CONFIGURATION',
+                    'message': 'Invalid configuration parameters.',
+                    'details': {'error': str(e)}
+                }
+            }), 400
 
         # Extract dataset name
         dataset_name = config.get('dataset')
         
         if not dataset_name:
-            return json.dumps({
+            return dumps({
                 'error': {
                     'code': 'DATASET_NOT_SPECIFIED',
                     'message': 'No dataset selected. Please select a dataset to visualize.'
@@ -109,12 +348,26 @@ def get_tasks():
         max_tasks = int(config.get('maxTasks', 1000))
         try:
             dataset = dataiku.Dataset(dataset_name)
-            df = dataset.get_dataframe()
-            # Track if we'll hit the display limit (0 = unlimited)
-            row_limit_hit = max_tasks > 0 and len(df) > max_tasks
+
+            # A preset's colors can change without the request changing, so
+            # the resolved palette is part of the cache key
+            color_palette, custom_colors = resolve_color_palette(config)
+
+            # Serve repeated requests from the cache (TTL-only freshness)
+            request_digest = hashlib.sha1(
+                f"{config_str}\0{filters_str}".encode('utf-8')
+            ).hexdigest()
+            cache_key = (dataset_name, color_palette, json.dumps(custom_colors), request_digest)
+            cached_body = _tasks_cache.get(cache_key)
+            if cached_body is not None:
+                return cached_body
+
+            df, filters_applied = read_dataset(
+                dataset, get_required_columns(config, filters), filters
+            )
         except Exception as e:
             logger.error(f"Failed to read dataset: {e}")
-            return json.dumps({
+            return dumps({
                 'error': {
                     'code': 'DATASET_NOT_FOUND',
                     'message': f"Dataset '{dataset_name}' not found or access denied.",
@@ -122,17 +375,35 @@ def get_tasks():
                 }
             }), 400
 
-        # Apply filters if provided
-        if filters:
+        # Apply filters if they could not be applied while reading. Filters
+        # that remove every row (ValueError) are ignored and the unfiltered
+        # rows are shown, whichever read path was taken.
+        if filters and not filters_applied:
             try:
                 df = apply_dataiku_filters(df, filters)
             except Exception as e:
                 logger.warning(f"Error applying filters: {e}")
                 # Continue without filters rather than failing
 
+        # Track if we'll hit the display limit (0 = unlimited); counted once
+        # the filters have run, so it is the same for both read paths
+        row_limit_hit = max_tasks > 0 and len(df) > max_tasks
+
+        # Drop columns only the filters needed (or that a full-read fallback
+        # brought in). If a configured column is missing, keep the frame as
+        # is so the column-not-found error lists every available column.
+        transform_columns = get_required_columns(config, [])
+        if len(transform_columns) < len(df.columns) and set(transform_columns).issubset(df.columns):
+            df = df[transform_columns]
+
+        # Integer dates are Unix timestamps; keep their full range
+        df = shrink_integer_columns(
+            df, skip_columns=(config.get('startColumn'), config.get('endColumn'))
+        )
+
         # Check for empty dataset
         if df.empty:
-            return json.dumps({
+            return dumps({
                 'error': {
                     'code': 'EMPTY_DATASET',
                     'message': 'Dataset is empty or all rows were filtered out.',
@@ -141,31 +412,6 @@ def get_tasks():
             }), 400
 
         # Build transformer config
-        # Handle custom palette from preset
-        color_palette = config.get('colorPalette', 'classic')
-        custom_colors = None
-
-        if color_palette == 'custom':
-            # Resolve the preset reference to actual values
-            preset_ref = config.get('customPalettePreset', {})
-            preset_config = resolve_preset(preset_ref, 'custom-palette')
-
-            if preset_config:
-                colors_json = preset_config.get('colors', '[]')
-                try:
-                    parsed_colors = json.loads(colors_json)
-                    if isinstance(parsed_colors, list) and len(parsed_colors) >= 6:
-                        custom_colors = parsed_colors[:12]  # Cap at 12 colors
-                    else:
-                        logger.warning("Custom palette must have at least 6 colors. Using classic.")
-                        color_palette = 'classic'
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON in custom palette colors: {e}. Using classic.")
-                    color_palette = 'classic'
-            else:
-                logger.warning("Custom palette selected but no preset configured. Using classic.")
-                color_palette = 'classic'
-
         try:
             transformer_config = TaskTransformerConfig(
                 id_column=config.get('idColumn'),
@@ -179,11 +425,11 @@ def get_tasks():
                 custom_colors=custom_colors,  # (#79)
                 tooltip_columns=config.get('tooltipColumns'),
                 group_by_columns=config.get('groupByColumns'),
-                max_tasks=int(config.get('maxTasks', 1000)),
+                max_tasks=max_tasks,
                 duplicate_id_handling=config.get('duplicateIdHandling', 'rename')  # (#76)
             )
         except Exception as e:
-            return json.dumps({
+            return dumps({
                 'error': {
                     'code': 'INVALID_CONFIGURATION',
                     'message': 'Invalid configuration parameters.',
@@ -208,7 +454,7 @@ def get_tasks():
         except ValueError as e:
             # Configuration validation error
             logger.error(f"Validation error: {e}")
-            return json.dumps({
+            return dumps({
                 'error': {
                     'code': 'COLUMN_NOT_FOUND',
                     'message': str(e),
@@ -220,7 +466,7 @@ def get_tasks():
 
         # Check if any valid tasks
         if not result['tasks']:
-            return json.dumps({
+            return dumps({
                 'error': {
                     'code': 'NO_VALID_TASKS',
                     'message': 'No valid tasks found. Check that your date columns contain valid dates and start dates are before end dates.',
@@ -237,12 +483,20 @@ def get_tasks():
         if custom_colors:
             result['customPaletteColors'] = custom_colors
 
-        return json.dumps(result)
+        if len(result['tasks']) > COLUMNAR_TASK_THRESHOLD:
+            result['tasksColumnar'] = to_columnar(result.pop('tasks'))
+
+        body = dumps_bytes(result)
+        _tasks_cache.set(cache_key, body)
+        return body
 
     except KeyError as e:
         logger.error(f"Column not found: {e}")
-        logger.error(traceback.format_exc())
-        return json.dumps({
+        # Configuration errors repeat on every poll; keep the stack walk
+        # for debugging sessions
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(traceback.format_exc())
+        return dumps({
             'error': {
                 'code': 'COLUMN_NOT_FOUND',
                 'message': f'Column not found: {str(e)}',
@@ -251,17 +505,86 @@ def get_tasks():
         }), 400
 
     except Exception as e:
-        logger.error(f"Error in get-tasks: {e}")
-        logger.error(traceback.format_exc())
-        return json.dumps({
+        # Format the traceback once; the response only carries an ID that
+        # points at the logged traceback unless DEBUG logging is on
+        error_id = uuid.uuid4().hex[:12]
+        tb = traceback.format_exc()
+        logger.error(f"Error in get-tasks [{error_id}]: {e}\n{tb}")
+        details = {'errorId': error_id}
+        if logger.isEnabledFor(logging.DEBUG):
+            details['traceback'] = tb
+        return dumps({
             'error': {
                 'code': 'INTERNAL_ERROR',
-                'message': f'Internal error: {str(e)}',
-                'details': {'traceback': traceback.format_exc()}
+                'message': f'Internal error: {str(e)} (error ID {error_id})',
+                'details': details
             }
         }), 500
 
 
+@app.after_request
+def compress_response(response):
+    """
+    Gzip response bodies when the browser accepts it.
+
+    Task JSON (repeated keys and date strings) typically compresses 5-10x.
+    Level 4 keeps compression time small next to the transform.
+    """
+    if (response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+
+    body = response.get_data()
+    if len(body) < GZIP_MIN_BYTES:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=4))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@lru_cache(maxsize=8)
+def build_gantt_config(config_json):
+    """
+    Build the serialized Frappe Gantt options for a webapp config.
+
+    Cached per process: the webapp params only change when the backend is
+    restarted, so every page load after the first reuses the same body.
+
+    Args:
+        config_json: Webapp config as a key-sorted JSON string (hashable)
+
+    Returns:
+        Frappe Gantt options object as UTF-8 JSON bytes
+    """
+    config = loads(config_json)
+
+    # Map webapp params to Frappe Gantt options
+    gantt_config = {
+        'view_mode': config.get('viewMode', 'Week'),
+        'view_mode_select': config.get('viewModeSelect', True),
+        'bar_height': int(config.get('barHeight', 30)),
+        'bar_corner_radius': int(config.get('barCornerRadius', 3)),
+        'column_width': int(config.get('columnWidth', 45)),
+        'padding': int(config.get('padding', 18)),
+        'readonly': config.get('readonly', True),
+        'popup_on': config.get('popupOn', 'click'),
+        'today_button': config.get('todayButton', True),
+        'scroll_to': config.get('scrollTo', 'today'),
+        'language': config.get('language', 'en')
+    }
+
+    # Handle weekend highlighting
+    if config.get('highlightWeekends', True):
+        gantt_config['holidays'] = {
+            'var(--g-weekend-highlight-color)': 'weekend'
+        }
+
+    return dumps_bytes(gantt_config)
+
+
 @app.route('/get-config')
 def get_config():
     """
@@ -272,29 +595,7 @@ def get_config():
     """
     try:
         config = get_webapp_config()
-
-        # Map webapp params to Frappe Gantt options
-        gantt_config = {
-            'view_mode': config.get('viewMode', 'Week'),
-            'view_mode_select': config.get('viewModeSelect', True),
-            'bar_height': int(config.get('barHeight', 30)),
-            'bar_corner_radius': int(config.get('barCornerRadius', 3)),
-            'column_width': int(config.get('columnWidth', 45)),
-            'padding': int(config.get('padding', 18)),
-            'readonly': config.get('readonly', True),
-            'popup_on': config.get('popupOn', 'click'),
-            'today_button': config.get('todayButton', True),
-            'scroll_to': config.get('scrollTo', 'today'),
-            'language': config.get('language', 'en')
-        }
-
-        # Handle weekend highlighting
-        if config.get('highlightWeekends', True):
-            gantt_config['holidays'] = {
-                'var(--g-weekend-highlight-color)': 'weekend'
-            }
-
-        return json.dumps(gantt_config)
+        return build_gantt_config(json.dumps(config, sort_keys=True, default=str))
 
     except Exception as e:
         logger.error(f"Error in get-config: {e}")
@@ -302,122 +603,29 @@ def get_config():
         return str(e), 500
 
 
-def apply_dataiku_filters(df, filters):
+def to_columnar(tasks):
     """
-    Apply filters from Dataiku's built-in filtering UI.
+    Convert task dicts to a columnar payload so each key is sent once.
 
-    Supports NUMERICAL_FACET, ALPHANUM_FACET, and DATE_FACET filter types.
+    Optional task keys are only present on some tasks; a task without a
+    key gets None in that column, which the frontend drops again (no
+    top-level task value is ever None).
 
     Args:
-        df: Input DataFrame
-        filters: List of filter dictionaries from Dataiku
+        tasks: List of task dictionaries
 
     Returns:
-        Filtered DataFrame
+        Dict with 'columns' (key names) and 'rows' (one value list per task)
     """
-    import pandas as pd
-    import numpy as np
-
-    def numerical_filter(df, filter):
-        """Apply numerical range filter."""
-        conditions = []
-        if filter.get("minValue"):
-            conditions.append(df[filter['column']] >= filter['minValue'])
-        if filter.get("maxValue"):
-            conditions.append(df[filter['column']] <= filter['maxValue'])
-        return conditions
-
-    def alphanum_filter(df, filter):
-        """Apply alphanumeric facet filter."""
-        conditions = []
-        excluded_values = []
-        for k, v in filter.get('excludedValues', {}).items():
-            if k != '___dku_no_value___':
-                if v:
-                    excluded_values.append(k)
-            else:
-                if v:
-                    conditions.append(~df[filter['column']].isnull())
-        if excluded_values:
-            if filter.get('columnType') == 'NUMERICAL':
-                excluded_values = [float(x) for x in excluded_values]
-            conditions.append(~df[filter['column']].isin(excluded_values))
-        return conditions
-
-    def date_filter(df, filter):
-        """Apply date filter."""
-        if filter.get("dateFilterType") == "RANGE":
-            return date_range_filter(df, filter)
-        else:
-            return special_date_filter(df, filter)
-
-    def date_range_filter(df, filter):
-        """Apply date range filter."""
-        conditions = []
-        if filter.get("minValue"):
-            conditions.append(
-                df[filter['column']] >= pd.Timestamp(filter['minValue'], unit='ms')
-            )
-        if filter.get("maxValue"):
-            conditions.append(
-                df[filter['column']] <= pd.Timestamp(filter['maxValue'], unit='ms')
-            )
-        return conditions
-
-    def special_date_filter(df, filter):
-        """Apply special date filters (year, month, day, etc.)."""
-        conditions = []
-        excluded_values = []
-        for k, v in filter.get('excludedValues', {}).items():
-            if v:
-                excluded_values.append(k)
-
-        if not excluded_values:
-            return conditions
-
-        filter_type = filter.get("dateFilterType")
-        if filter_type == "YEAR":
-            conditions.append(~df[filter['column']].dt.year.isin(excluded_values))
-        elif filter_type == "QUARTER_OF_YEAR":
-            conditions.append(~df[filter['column']].dt.quarter.isin([int(k)+1 for k in excluded_values]))
-        elif filter_type == "MONTH_OF_YEAR":
-            conditions.append(~df[filter['column']].dt.month.isin([int(k)+1 for k in excluded_values]))
-        elif filter_type == "WEEK_OF_YEAR":
-            conditions.append(~df[filter['column']].dt.isocalendar().week.isin([int(k)+1 for k in excluded_values]))
-        elif filter_type == "DAY_OF_MONTH":
-            conditions.append(~df[filter['column']].dt.day.isin([int(k)+1 for k in excluded_values]))
-        elif filter_type == "DAY_OF_WEEK":
-            conditions.append(~df[filter['column']].dt.dayofweek.isin(excluded_values))
-        elif filter_type == "HOUR_OF_DAY":
-            conditions.append(~df[filter['column']].dt.hour.isin(excluded_values))
-
-        return conditions
-
-    def apply_conditions(df, conditions):
-        """Apply list of conditions to DataFrame."""
-        if not conditions:
-            return df
-        elif len(conditions) == 1:
-            return df[conditions[0]]
-        else:
-            return df[reduce(lambda c1, c2: c1 & c2, conditions)]
-
-    # Apply each filter
-    for f in filters:
-        try:
-            filter_type = f.get("filterType")
-            if filter_type == "NUMERICAL_FACET":
-                df = apply_conditions(df, numerical_filter(df, f))
-            elif filter_type == "ALPHANUM_FACET":
-                df = apply_conditions(df, alphanum_filter(df, f))
-            elif filter_type == "DATE_FACET":
-                df = apply_conditions(df, date_filter(df, f))
-        except Exception as e:
-            logger.warning(
-                f"Error applying filter on column {f.get('column')}: {e}"
-            )
-
-    if df.empty:
-        raise ValueError("DataFrame is empty after filtering")
-
-    return df
+    columns = list(dict.fromkeys(key for task in tasks for key in task))
+    # Tasks carrying every key (the common case) are read in one C-level
+    # itemgetter call; only the rest fall back to per-key lookups.
+    full_row = itemgetter(*columns)
+    width = len(columns)
+    return {
+        'columns': columns,
+        'rows': [
+            full_row(task) if len(task) == width else [task.get(key) for key in columns]
+            for task in tasks
+        ]
+    }